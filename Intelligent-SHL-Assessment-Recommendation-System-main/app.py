@@ -6,6 +6,7 @@ This module provides a web interface for users to interact with the recommendati
 
 import streamlit as st
 import requests
+import orjson
 import time
 
 # Page configuration
@@ -28,6 +29,65 @@ st.markdown(
 # API endpoint configuration
 API_URL = "http://127.0.0.1:8000"
 
+
+@st.cache_resource
+def _session():
+    """Shared HTTP session so API calls reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _render_recommendation(i, rec):
+    """Display a single recommended assessment."""
+    with st.container():
+        # Assessment name and link
+        col1, col2 = st.columns([4, 1])
+        
+        with col1:
+            st.markdown(f"### {i}. {rec.get('assessment_name', 'Unknown Assessment')}")
+        
+        with col2:
+            # Handle both 'url' and 'assessment_url' for compatibility
+            url = rec.get('url', rec.get('assessment_url', '#'))
+            st.markdown(f"[🔗 View Details]({url})")
+        
+        # Description
+        if rec.get('description'):
+            with st.expander("📝 Description", expanded=False):
+                st.write(rec['description'])
+        
+        # Why it's a great fit
+        if rec.get('why_great_fit'):
+            st.info(f"💡 **Why this is a great fit:** {rec['why_great_fit']}")
+        
+        # Assessment length
+        if rec.get('assessment_length'):
+            st.caption(f"⏱️ **Assessment Length:** {rec['assessment_length']}")
+        
+        st.markdown("---")
+
+
+@st.cache_data
+def _summary_table(recommendations):
+    """Build the summary table columns in a single pass over the results."""
+    names, descriptions, lengths, urls = [], [], [], []
+    for r in recommendations:
+        description = r.get("description", "")
+        names.append(r.get("assessment_name", ""))
+        descriptions.append(description[:100] + "..." if len(description) > 100 else description)
+        lengths.append(r.get("assessment_length", "Not specified"))
+        urls.append(r.get("url", r.get("assessment_url", "")))
+    return {
+        "Assessment Name": names,
+        "Description": descriptions,
+        "Length": lengths,
+        "URL": urls
+    }
+
+
 # Sidebar for configuration
 with st.sidebar:
     st.header("⚙️ Configuration")
@@ -59,63 +119,37 @@ if st.button("🔍 Get Recommendations", type="primary", use_container_width=Tru
         # Show loading spinner
         with st.spinner("🤔 Analyzing your query and generating recommendations..."):
             try:
-                # Make API request
-                response = requests.post(
-                    f"{api_url}/recommend",
+                # Make API request; results stream back one per line
+                response = _session().post(
+                    f"{api_url}/recommend/stream",
                     json={"query": query.strip()},
-                    timeout=60
+                    timeout=60,
+                    stream=True
                 )
                 
                 # Check response status
                 if response.status_code == 200:
-                    data = response.json()
-                    recommendations = data.get("recommendations", [])
+                    status = st.empty()
+                    recommendations = []
+                    
+                    # Display recommendations as they stream in
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        rec = orjson.loads(line)
+                        if not recommendations:
+                            st.markdown("---")
+                            st.subheader("📊 Recommended Assessments")
+                        recommendations.append(rec)
+                        _render_recommendation(len(recommendations), rec)
                     
                     if recommendations:
-                        st.success(f"✅ Found {len(recommendations)} recommended assessments!")
-                        st.markdown("---")
-                        
-                        # Display recommendations
-                        st.subheader("📊 Recommended Assessments")
-                        
-                        for i, rec in enumerate(recommendations, 1):
-                            with st.container():
-                                # Assessment name and link
-                                col1, col2 = st.columns([4, 1])
-                                
-                                with col1:
-                                    st.markdown(f"### {i}. {rec.get('assessment_name', 'Unknown Assessment')}")
-                                
-                                with col2:
-                                    # Handle both 'url' and 'assessment_url' for compatibility
-                                    url = rec.get('url', rec.get('assessment_url', '#'))
-                                    st.markdown(f"[🔗 View Details]({url})")
-                                
-                                # Description
-                                if rec.get('description'):
-                                    with st.expander("📝 Description", expanded=False):
-                                        st.write(rec['description'])
-                                
-                                # Why it's a great fit
-                                if rec.get('why_great_fit'):
-                                    st.info(f"💡 **Why this is a great fit:** {rec['why_great_fit']}")
-                                
-                                # Assessment length
-                                if rec.get('assessment_length'):
-                                    st.caption(f"⏱️ **Assessment Length:** {rec['assessment_length']}")
-                                
-                                st.markdown("---")
+                        status.success(f"✅ Found {len(recommendations)} recommended assessments!")
                         
                         # Alternative: Display as dataframe
                         st.subheader("📋 Summary Table")
-                        df_data = {
-                            "Assessment Name": [r.get("assessment_name", "") for r in recommendations],
-                            "Description": [r.get("description", "")[:100] + "..." if len(r.get("description", "")) > 100 else r.get("description", "") for r in recommendations],
-                            "Length": [r.get("assessment_length", "Not specified") for r in recommendations],
-                            "URL": [r.get("url", r.get("assessment_url", "")) for r in recommendations]
-                        }
                         st.dataframe(
-                            df_data,
+                            _summary_table(recommendations),
                             use_container_width=True,
                             hide_index=True,
                             column_config={
@@ -131,11 +165,11 @@ if st.button("🔍 Get Recommendations", type="primary", use_container_width=Tru
                         st.warning("⚠️ No recommendations found. Try refining your query.")
                         
                 elif response.status_code == 400:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     st.error(f"❌ Bad Request: {error_data.get('detail', 'Invalid request')}")
                     
                 elif response.status_code == 500:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     st.error(f"❌ Server Error: {error_data.get('detail', 'Internal server error')}")
                     st.info("💡 Make sure the vector store files are generated and the Groq API key is set correctly.")
                     
@@ -7,11 +7,72 @@ for semantic search using sentence transformers.
 
 import pandas as pd
 import faiss
-import pickle
+import pyarrow as pa
 import os
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from tqdm import tqdm
+import torch
+
+ENCODE_BATCH_SIZE = 128
+GPU_ENCODE_BATCH_SIZE = 256
+
+# HNSW graph parameters: neighbours per node and build-time search depth
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+
+REQUIRED_FIELDS = [
+    'assessment_name',
+    'assessment_url',
+    'assessment_description',
+    'assessment_type',
+]
+
+# Optional CSV columns and their labels in the embedded document
+OPTIONAL_FIELDS = [
+    ('job_levels', 'Job Levels'),
+    ('languages', 'Languages'),
+    ('assessment_length', 'Assessment Length'),
+]
+
+# Canonical hiring queries, stored lowercase with single spaces to match
+# the engine's query normalization
+QUERY_TEMPLATES = [
+    'java developer',
+    'python developer',
+    'javascript developer',
+    '.net developer',
+    'sql developer',
+    'full stack developer',
+    'software engineer',
+    'qa engineer',
+    'data analyst',
+    'data scientist',
+    'business analyst',
+    'project manager',
+    'product manager',
+    'sales representative',
+    'sales manager',
+    'customer service representative',
+    'contact center agent',
+    'administrative assistant',
+    'bank teller',
+    'accountant',
+    'financial analyst',
+    'marketing manager',
+    'hr manager',
+    'team leader',
+    'senior manager',
+    'graduate trainee',
+    'entry level hire',
+    'cognitive ability test',
+    'numerical reasoning test',
+    'verbal reasoning test',
+    'personality assessment',
+    'situational judgement test',
+    'leadership assessment',
+    'communication skills assessment',
+    'teamwork and collaboration assessment',
+]
 
 
 def build_vector_store():
@@ -20,7 +81,8 @@ def build_vector_store():
     
     Creates:
         - data/faiss_index.bin: FAISS index file
-        - data/index_to_data.pkl: Mapping from index to assessment data
+        - data/index_to_data.arrow: Mapping from index to assessment data
+        - data/template_embeddings.npz: Embeddings of canonical hiring queries
     """
     # Load the CSV file
     csv_path = 'data/shl_assessments.csv'
@@ -38,73 +100,72 @@ def build_vector_store():
     
     print(f"Loaded {len(df)} assessments.")
     
-    # Initialize the sentence transformer model
-    print("Loading sentence transformer model: all-MiniLM-L6-v2...")
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    # Initialize the sentence transformer model, on GPU in FP16 when available
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    print(f"Loading sentence transformer model: all-MiniLM-L6-v2 ({device})...")
+    model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+    if device == 'cuda':
+        model.half()
+    batch_size = GPU_ENCODE_BATCH_SIZE if device == 'cuda' else ENCODE_BATCH_SIZE
     
     # Get the embedding dimension
     embedding_dim = model.get_sentence_embedding_dimension()
     print(f"Embedding dimension: {embedding_dim}")
     
+    # Missing values become empty strings so optional fields can be skipped
+    df = df.fillna('')
+    
     # Create consolidated documents for embedding
     print("Creating consolidated documents...")
-    documents = []
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Processing documents"):
-        # Build comprehensive document with all available information
-        doc_parts = [
-            f"Name: {row['assessment_name']}",
-            f"Type: {row['assessment_type']}",
-            f"Description: {row['assessment_description']}"
-        ]
-        
-        # Add optional fields if they exist
-        if 'job_levels' in row and pd.notna(row['job_levels']) and row['job_levels']:
-            doc_parts.append(f"Job Levels: {row['job_levels']}")
-        
-        if 'languages' in row and pd.notna(row['languages']) and row['languages']:
-            doc_parts.append(f"Languages: {row['languages']}")
-        
-        if 'assessment_length' in row and pd.notna(row['assessment_length']) and row['assessment_length']:
-            doc_parts.append(f"Assessment Length: {row['assessment_length']}")
-        
-        doc = "\n".join(doc_parts)
-        documents.append(doc)
+    documents = (
+        "Name: " + df['assessment_name'].astype(str)
+        + "\nType: " + df['assessment_type'].astype(str)
+        + "\nDescription: " + df['assessment_description'].astype(str)
+    )
+    
+    # Add optional fields if they exist
+    for column, label in OPTIONAL_FIELDS:
+        if column in df.columns:
+            values = df[column].astype(str)
+            documents = documents + np.where(values != '', f"\n{label}: " + values, '')
+    
+    documents = documents.tolist()
     
     # Generate embeddings
+    # encode() already batches documents by length and returns them in input
+    # order. Embeddings are normalized to unit length so inner product
+    # equals cosine similarity.
     print("Generating embeddings...")
-    embeddings = model.encode(documents, show_progress_bar=True, convert_to_numpy=True)
+    embeddings = model.encode(
+        documents,
+        batch_size=batch_size,
+        show_progress_bar=True,
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    )
     
     # Ensure embeddings are float32 for FAISS
     embeddings = embeddings.astype('float32')
     
-    # Create FAISS index
+    # Create FAISS HNSW index (graph search instead of brute-force scan)
+    # with 8-bit scalar-quantized vector storage (4x smaller than float32)
     print("Creating FAISS index...")
-    index = faiss.IndexFlatL2(embedding_dim)
+    index = faiss.IndexHNSWSQ(
+        embedding_dim, faiss.ScalarQuantizer.QT_8bit, HNSW_M, faiss.METRIC_INNER_PRODUCT
+    )
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
     
-    # Add embeddings to index
+    # Train the quantizer ranges, then add embeddings to index
+    index.train(embeddings)
     index.add(embeddings)
     print(f"Index created with {index.ntotal} vectors.")
     
     # Create mapping from index position to assessment data
     print("Creating index-to-data mapping...")
-    index_to_data = []
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Creating mappings"):
-        data_item = {
-            'assessment_name': row['assessment_name'],
-            'assessment_url': row['assessment_url'],
-            'assessment_description': row['assessment_description'],
-            'assessment_type': row['assessment_type']
-        }
-        
-        # Add optional fields if they exist
-        if 'job_levels' in row:
-            data_item['job_levels'] = row['job_levels'] if pd.notna(row['job_levels']) else ""
-        if 'languages' in row:
-            data_item['languages'] = row['languages'] if pd.notna(row['languages']) else ""
-        if 'assessment_length' in row:
-            data_item['assessment_length'] = row['assessment_length'] if pd.notna(row['assessment_length']) else ""
-        
-        index_to_data.append(data_item)
+    mapping_columns = REQUIRED_FIELDS + [
+        column for column, _ in OPTIONAL_FIELDS if column in df.columns
+    ]
+    index_to_data = pa.Table.from_pandas(df[mapping_columns].astype(str), preserve_index=False)
     
     # Ensure data directory exists
     os.makedirs('data', exist_ok=True)
@@ -114,15 +175,29 @@ def build_vector_store():
     faiss.write_index(index, index_path)
     print(f"FAISS index saved to: {index_path}")
     
-    # Save mapping using pickle
-    mapping_path = 'data/index_to_data.pkl'
-    with open(mapping_path, 'wb') as f:
-        pickle.dump(index_to_data, f)
+    # Save mapping as an Arrow IPC file so the engine can memory-map it
+    mapping_path = 'data/index_to_data.arrow'
+    with pa.OSFile(mapping_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, index_to_data.schema) as writer:
+            writer.write_table(index_to_data)
     print(f"Index-to-data mapping saved to: {mapping_path}")
     
+    # Pre-encode canonical hiring queries so the engine can skip encoding them
+    print("Encoding query templates...")
+    template_embeddings = model.encode(
+        QUERY_TEMPLATES,
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    ).astype('float32')
+    templates_path = 'data/template_embeddings.npz'
+    np.savez(templates_path, queries=np.array(QUERY_TEMPLATES), embeddings=template_embeddings)
+    print(f"Query template embeddings saved to: {templates_path}")
+    
     print("\nVector store build complete!")
     print(f"  - Index file: {index_path}")
     print(f"  - Mapping file: {mapping_path}")
+    print(f"  - Templates file: {templates_path}")
     print(f"  - Total vectors: {index.ntotal}")
 
 
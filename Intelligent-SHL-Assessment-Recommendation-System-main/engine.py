@@ -6,10 +6,18 @@ pipeline that powers the SHL assessment recommendation system.
 """
 
 import os
-import json
-import faiss
 import pickle
+import httpx
+import orjson
+import faiss
+import pyarrow as pa
+import threading
 import numpy as np
+import torch
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from typing import Callable, List, Optional
+from cachetools import TTLCache
 from sentence_transformers import SentenceTransformer
 from groq import Groq
 from dotenv import load_dotenv
@@ -33,51 +41,172 @@ except UnicodeDecodeError:
         print(f"Error loading .env file: {e}", file=sys.stderr)
 
 
-def get_recommendations(query: str) -> list:
+INDEX_PATH = 'data/faiss_index.bin'
+MAPPING_PATH = 'data/index_to_data.arrow'
+TEMPLATES_PATH = 'data/template_embeddings.npz'
+RESULT_CACHE_PATH = 'data/rec_cache.pkl'
+
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Quantized ONNX weights shipped with the model; override for other CPUs
+# (e.g. onnx/model_qint8_avx512.onnx or onnx/model_qint8_arm64.onnx)
+EMBEDDING_ONNX_FILE = os.getenv('EMBEDDING_ONNX_FILE', 'onnx/model_quint8_avx2.onnx')
+
+# HNSW search depth; must be >= the number of retrieved candidates
+HNSW_EF_SEARCH = 64
+
+# OpenMP threads per process for FAISS search
+FAISS_NUM_THREADS = int(os.getenv('FAISS_NUM_THREADS', '2'))
+
+# Keep-alive pool shared by every request to the Groq API
+GROQ_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+
+# Concurrent LLM re-rank calls in get_recommendations_batch; the calls are
+# network-bound, so this is bounded by the Groq rate limit rather than CPU
+RERANK_WORKERS = int(os.getenv('RERANK_WORKERS', '16'))
+
+# Recommendations per normalized query; only LLM-ranked answers are cached,
+# never the fallbacks returned when the LLM call fails
+RESULT_CACHE_SIZE = 4096
+_result_cache = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=3600)
+_result_cache_lock = threading.Lock()
+
+
+def _load_once(loader):
     """
-    Get assessment recommendations using RAG pipeline.
+    Cache a no-argument loader like lru_cache(maxsize=1), but thread-safe.
     
-    Args:
-        query: User's hiring query, job description text, or URL containing a JD
-        
-    Returns:
-        list: List of dictionaries with 'assessment_name' and 'assessment_url' keys
-        (minimum 5, maximum 10 recommendations)
+    lru_cache alone lets two threads run the first call concurrently, so a
+    request arriving during warmup would load a second copy of the model
+    or index. The lock makes later callers wait for the first load.
     """
-    # Process query - extract text if URL is provided
-    query = process_query(query)
-    # Load FAISS index and mapping data
-    index_path = 'data/faiss_index.bin'
-    mapping_path = 'data/index_to_data.pkl'
+    cached = lru_cache(maxsize=1)(loader)
+    lock = threading.Lock()
+    
+    @wraps(loader)
+    def wrapper():
+        with lock:
+            return cached()
     
-    if not os.path.exists(index_path) or not os.path.exists(mapping_path):
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _check_vector_store():
+    """Raise FileNotFoundError if the vector store files are missing."""
+    if not os.path.exists(INDEX_PATH) or not os.path.exists(MAPPING_PATH):
         raise FileNotFoundError(
             "Vector store files not found. Please run build_vector_store.py first."
         )
+
+
+@_load_once
+def _index():
+    """Load the FAISS index once per process."""
+    _check_vector_store()
+    print("Loading FAISS index...")
+    # Cap OpenMP threads so several API workers do not oversubscribe the CPU
+    faiss.omp_set_num_threads(FAISS_NUM_THREADS)
+    print(f"FAISS compile options: {faiss.get_compile_options()}")
+    if hasattr(faiss, 'supported_instruction_sets'):
+        print(f"FAISS supported instruction sets: {sorted(faiss.supported_instruction_sets())}")
+    # Memory-map read-only so worker processes can share the index pages
+    index = faiss.read_index(INDEX_PATH, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+    return index
+
+
+@_load_once
+def _mapping():
+    """
+    Load the index-to-data mapping once per process.
     
-    print("Loading FAISS index and mapping data...")
-    index = faiss.read_index(index_path)
+    Returns a memory-mapped Arrow table; rows are only turned into dicts
+    for the retrieved candidates.
+    """
+    _check_vector_store()
+    print("Loading index-to-data mapping...")
+    return pa.ipc.open_file(pa.memory_map(MAPPING_PATH)).read_all()
+
+
+@_load_once
+def _model():
+    """Load the sentence transformer model once per process."""
+    print("Loading sentence transformer model...")
+    # Inference only: skip autograd bookkeeping and use every core
+    torch.set_grad_enabled(False)
+    torch.set_num_threads(os.cpu_count() or 1)
     
-    with open(mapping_path, 'rb') as f:
-        index_to_data = pickle.load(f)
+    # Prefer the INT8-quantized ONNX export for fast CPU inference
+    try:
+        return SentenceTransformer(
+            EMBEDDING_MODEL,
+            device='cpu',
+            backend='onnx',
+            model_kwargs={'file_name': EMBEDDING_ONNX_FILE}
+        )
+    except Exception as e:
+        print(f"ONNX encoder unavailable ({e}), falling back to PyTorch...")
+        return SentenceTransformer(EMBEDDING_MODEL)
+
+
+@_load_once
+def _templates():
+    """
+    Load pre-encoded query templates, or None if they were not built.
     
-    # Load sentence transformer model
-    print("Loading sentence transformer model...")
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    Returns (rows, embeddings), where rows maps each normalized template
+    query to its row in embeddings.
+    """
+    if not os.path.exists(TEMPLATES_PATH):
+        return None
+    with np.load(TEMPLATES_PATH) as data:
+        rows = {_cache_key(query): row for row, query in enumerate(data['queries'].tolist())}
+        return rows, data['embeddings']
+
+
+def _template_embedding(query: str):
+    """
+    Return the stored embedding of a template query.
     
-    # Load Groq API key and initialize client
+    Returns a (1, dim) float32 array when the normalized query equals a
+    template, otherwise None. Only exact matches are reused: near matches
+    such as 'pr manager' and 'hr manager' are different roles.
+    """
+    templates = _templates()
+    if templates is None:
+        return None
+    rows, embeddings = templates
+    row = rows.get(_cache_key(query))
+    if row is None:
+        return None
+    print(f"Using pre-encoded template embedding: '{_cache_key(query)}'")
+    return embeddings[row:row + 1].copy()
+
+
+def _groq_api_key() -> str:
+    """Read the Groq API key from the environment."""
     groq_api_key = os.getenv('GROQ_API_KEY')
     if not groq_api_key:
         raise ValueError("GROQ_API_KEY not found in .env file")
     
     # Clean up API key (remove quotes if present)
-    groq_api_key = groq_api_key.strip().strip('"').strip("'")
+    return groq_api_key.strip().strip('"').strip("'")
+
+
+@_load_once
+def _groq_client():
+    """Initialize the Groq client once per process."""
+    groq_api_key = _groq_api_key()
+    # Pooled HTTP/2 connection reused across all Groq calls
+    http_client = httpx.Client(http2=True, limits=GROQ_HTTP_LIMITS)
     
     # Initialize Groq client
     # Workaround for old Groq library versions (0.4.1) that have proxies issue
     try:
         # Try standard initialization
-        client = Groq(api_key=groq_api_key)
+        client = Groq(api_key=groq_api_key, http_client=http_client)
     except Exception as e:
         error_msg = str(e)
         # Check if it's the proxies error (common in groq 0.4.1)
@@ -95,7 +224,7 @@ def get_recommendations(query: str) -> list:
                 groq._client.Client.__init__ = patched_init
                 
                 # Now try again
-                client = Groq(api_key=groq_api_key)
+                client = Groq(api_key=groq_api_key, http_client=http_client)
             except Exception as e2:
                 raise ValueError(
                     f"Failed to initialize Groq client due to version compatibility issue. "
@@ -106,41 +235,279 @@ def get_recommendations(query: str) -> list:
         else:
             raise ValueError(f"Failed to initialize Groq client: {error_msg}")
     
+    return client
+
+
+def warmup():
+    """
+    Load all engine resources and run one dummy encode.
+    
+    Call once at server startup so the first real request does not pay
+    for model loading or first-inference initialization.
+    """
+    try:
+        _index()
+        _mapping()
+    except FileNotFoundError as e:
+        print(f"Warning: {e}")
+    _model().encode(["warmup"], convert_to_numpy=True)
+    try:
+        _groq_client()
+    except ValueError as e:
+        print(f"Warning: Groq client not initialized during warmup: {e}")
+
+
+def _cache_key(query: str) -> str:
+    """Normalize a query for result-cache lookups."""
+    return ' '.join(query.split()).lower()
+
+
+def _cache_get(key: str):
+    """Return a copy of the cached recommendations for key, or None."""
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+    if cached is None:
+        return None
+    print("Returning cached recommendations.")
+    return [dict(rec) for rec in cached]
+
+
+def _cache_put(key: str, recommendations: list):
+    """Store a copy of recommendations under key."""
+    with _result_cache_lock:
+        _result_cache[key] = tuple(dict(rec) for rec in recommendations)
+
+
+def is_cached(query: str) -> bool:
+    """Return True if the result cache holds recommendations for query."""
+    key = _cache_key(query)
+    with _result_cache_lock:
+        return key in _result_cache
+
+
+def _index_mtime():
+    """Modification time of the FAISS index, or None if it does not exist."""
+    try:
+        return os.path.getmtime(INDEX_PATH)
+    except OSError:
+        return None
+
+
+def load_result_cache(path: str = RESULT_CACHE_PATH) -> int:
+    """
+    Load recommendations saved by save_result_cache into the result cache.
+    
+    The file is discarded if the FAISS index has been rebuilt since it was
+    saved, as its recommendations came from the old index.
+    
+    Args:
+        path: Pickle file written by save_result_cache
+        
+    Returns:
+        int: Number of cached queries loaded
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as f:
+        saved = pickle.load(f)
+    if not isinstance(saved, dict) or saved.get('index_mtime') != _index_mtime():
+        print(f"Discarding {path}: the vector store has changed since it was saved")
+        os.remove(path)
+        return 0
+    entries = saved['entries']
+    with _result_cache_lock:
+        _result_cache.update(entries)
+    print(f"Loaded {len(entries)} cached recommendations from {path}")
+    return len(entries)
+
+
+def save_result_cache(path: str = RESULT_CACHE_PATH):
+    """
+    Persist the result cache so later runs can reuse it.
+    
+    Args:
+        path: Pickle file to write
+    """
+    with _result_cache_lock:
+        entries = dict(_result_cache.items())
+    saved = {'index_mtime': _index_mtime(), 'entries': entries}
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(saved, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"Saved {len(entries)} cached recommendations to {path}")
+
+
+def get_recommendations(query: str) -> list:
+    """
+    Get assessment recommendations using RAG pipeline.
+    
+    Results are cached per normalized query, so repeated queries skip
+    retrieval and the LLM call.
+    
+    Args:
+        query: User's hiring query, job description text, or URL containing a JD
+        
+    Returns:
+        list: List of dictionaries with 'assessment_name' and 'assessment_url' keys
+        (minimum 5, maximum 10 recommendations)
+    """
+    key = _cache_key(query)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
+    recommendations, fallback = _generate_recommendations(query)
+    if not fallback:
+        _cache_put(key, recommendations)
+    return recommendations
+
+
+def get_recommendations_batch(queries: List[str], batch_size: int = 64,
+                              on_result: Optional[Callable[[int, object], None]] = None) -> List[list]:
+    """
+    Get recommendations for many queries at once.
+    
+    Queries that are not already cached are embedded in one encoder call
+    and searched in one FAISS call; the LLM re-rank calls then run
+    concurrently in a thread pool. Repeated queries are only processed once.
+    
+    A query that fails (e.g. a URL that cannot be fetched) does not fail
+    the batch: its slot holds the exception instead of a list. Setup
+    errors such as a missing vector store or API key are still raised.
+    
+    Args:
+        queries: Hiring queries, job description texts, or URLs
+        batch_size: Encoder batch size
+        on_result: Called as on_result(i, result) as soon as query i is
+            done, from the calling thread
+        
+    Returns:
+        list: One recommendations list (or Exception) per query, in input order
+    """
+    results = [None] * len(queries)
+    keys = [_cache_key(query) for query in queries]
+    pending = {}
+    repeats = {}
+    for i, key in enumerate(keys):
+        if key in pending:
+            repeats.setdefault(pending[key], []).append(i)
+            continue
+        results[i] = _cache_get(key)
+        if results[i] is None:
+            pending[key] = i
+    
+    def finish(i, result):
+        """Record query i's result and report it and its repeats."""
+        results[i] = result
+        # Repeated queries share the first occurrence's recommendations
+        for j in repeats.get(i, []):
+            results[j] = result if isinstance(result, Exception) else [dict(rec) for rec in result]
+        if on_result is not None:
+            for j in [i] + repeats.get(i, []):
+                on_result(j, results[j])
+    
+    # Cached queries are already done
+    if on_result is not None:
+        for i, result in enumerate(results):
+            if result is not None:
+                on_result(i, result)
+    
+    if pending:
+        client = _groq_client()
+        
+        # The Groq client shares one thread-safe httpx pool across workers
+        with ThreadPoolExecutor(max_workers=max(1, min(RERANK_WORKERS, len(pending)))) as executor:
+            # Process queries - URL fetches run concurrently instead of one by one
+            fetches = [(i, executor.submit(process_query, queries[i])) for i in pending.values()]
+            indices = []
+            processed = []
+            for i, future in fetches:
+                try:
+                    processed.append(future.result())
+                    indices.append(i)
+                except Exception as e:
+                    print(f"Error processing query: {e}")
+                    finish(i, e)
+            
+            retrieved_batch = _retrieve_batch(processed, batch_size=batch_size) if processed else []
+            futures = {
+                executor.submit(_rerank, client, query, retrieved): i
+                for i, query, retrieved in zip(indices, processed, retrieved_batch)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    recommendations, fallback = future.result()
+                    if not fallback:
+                        _cache_put(keys[i], recommendations)
+                    finish(i, recommendations)
+                except Exception as e:
+                    print(f"Error re-ranking query: {e}")
+                    finish(i, e)
+    
+    return results
+
+
+def _retrieve(query: str) -> list:
+    """Return the top candidate assessments for a query from the FAISS index."""
+    return _retrieve_batch([query])[0]
+
+
+def _retrieve_batch(queries: List[str], batch_size: int = 64) -> List[list]:
+    """Return the top candidate assessments for each query from the FAISS index."""
+    index = _index()
+    index_to_data = _mapping()
+    
     # RETRIEVAL STEP
     print("Performing semantic search...")
-    # Convert query to vector
-    query_embedding = model.encode([query], convert_to_numpy=True).astype('float32')
+    # Convert queries to vectors, reusing template embeddings where possible
+    embeddings = [_template_embedding(query) for query in queries]
+    to_encode = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if to_encode:
+        encoded = _model().encode(
+            [queries[i] for i in to_encode], batch_size=batch_size, convert_to_numpy=True
+        ).astype('float32')
+        # Index stores unit vectors; normalize so inner product is cosine similarity
+        faiss.normalize_L2(encoded)
+        for row, i in enumerate(to_encode):
+            embeddings[i] = encoded[row:row + 1]
+    query_embeddings = np.vstack(embeddings)
     
-    # Search for top 20 most similar assessments
+    # Search for top 20 most similar assessments per query
     k = 20
-    distances, indices = index.search(query_embedding, k)
-    
-    # Retrieve full details of top candidates
-    retrieved_assessments = []
-    for idx in indices[0]:
-        if idx < len(index_to_data):
-            retrieved_assessments.append(index_to_data[idx])
+    distances, indices = index.search(query_embeddings, k)
     
+    # Retrieve full details of top candidates (FAISS pads missing hits with -1)
+    len_map = index_to_data.num_rows
+    return [
+        index_to_data.take([idx for idx in row if 0 <= idx < len_map]).to_pylist()
+        for row in indices
+    ]
+
+
+def _build_prompt(query: str, retrieved_assessments: list) -> str:
+    """Build the re-ranking prompt from the query and retrieved candidates."""
     # Format retrieved context for the prompt
-    retrieved_context = ""
+    parts = []
     for i, assessment in enumerate(retrieved_assessments, 1):
-        retrieved_context += f"{i}. **{assessment['assessment_name']}**\n"
-        retrieved_context += f"   Type: {assessment['assessment_type']}\n"
-        retrieved_context += f"   Description: {assessment['assessment_description']}\n"
+        parts.append(f"{i}. **{assessment['assessment_name']}**\n")
+        parts.append(f"   Type: {assessment['assessment_type']}\n")
+        parts.append(f"   Description: {assessment['assessment_description']}\n")
         
         # Add optional fields if available
-        if 'job_levels' in assessment and assessment.get('job_levels'):
-            retrieved_context += f"   Job Levels: {assessment['job_levels']}\n"
-        if 'languages' in assessment and assessment.get('languages'):
-            retrieved_context += f"   Languages: {assessment['languages']}\n"
-        if 'assessment_length' in assessment and assessment.get('assessment_length'):
-            retrieved_context += f"   Assessment Length: {assessment['assessment_length']}\n"
+        if assessment.get('job_levels'):
+            parts.append(f"   Job Levels: {assessment['job_levels']}\n")
+        if assessment.get('languages'):
+            parts.append(f"   Languages: {assessment['languages']}\n")
+        if assessment.get('assessment_length'):
+            parts.append(f"   Assessment Length: {assessment['assessment_length']}\n")
         
-        retrieved_context += f"   URL: {assessment['assessment_url']}\n\n"
+        parts.append(f"   URL: {assessment['assessment_url']}\n\n")
+    retrieved_context = "".join(parts)
     
     # GENERATION STEP
     # Construct the prompt
-    prompt = f"""**Role:** You are an expert HR Recruitment Assistant specializing in SHL assessments. Your primary goal is to provide precise, balanced, and relevant assessment recommendations based on a user's hiring query and a list of potential assessments.
+    return f"""**Role:** You are an expert HR Recruitment Assistant specializing in SHL assessments. Your primary goal is to provide precise, balanced, and relevant assessment recommendations based on a user's hiring query and a list of potential assessments.
 
 **User's Hiring Query:**
 
@@ -180,146 +547,293 @@ Here is a numbered list of potentially relevant assessments retrieved based on t
    
    Do not include any introductory text, explanations, or markdown formatting around the JSON.
 """
+
+
+def _completion_kwargs(prompt: str) -> dict:
+    """Groq chat completion arguments for the re-ranking prompt."""
+    return {
+        'messages': [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        'model': "llama-3.1-8b-instant",
+        'temperature': 0.3,
+        'max_tokens': 4000
+    }
+
+
+def _extract_json_text(response_text: str) -> str:
+    """Strip markdown code fences the model sometimes wraps around its JSON."""
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0].strip()
+    return response_text
+
+
+def _validate_recommendation(item, by_url: dict):
+    """
+    Normalize one model-produced recommendation.
+    
+    Returns None if the item lacks the required keys; missing optional
+    fields are filled from the retrieved assessment with the same URL
+    (by_url maps assessment_url to retrieved assessment).
+    """
+    if not (isinstance(item, dict) and 'assessment_name' in item and 'assessment_url' in item):
+        return None
+    
+    # Build recommendation with all available fields
+    rec = {
+        'assessment_name': item['assessment_name'],
+        'assessment_url': item['assessment_url']
+    }
+    
+    # Add optional fields if provided by the model
+    if 'description' in item:
+        rec['description'] = item['description']
+    elif 'assessment_description' in item:
+        rec['description'] = item['assessment_description']
+    else:
+        # Try to get from retrieved assessments by matching URL
+        matching_assessment = by_url.get(rec['assessment_url'])
+        if matching_assessment and matching_assessment.get('assessment_description'):
+            rec['description'] = matching_assessment['assessment_description']
+        else:
+            rec['description'] = ""
+    
+    if 'why_great_fit' in item:
+        rec['why_great_fit'] = item['why_great_fit']
+    else:
+        rec['why_great_fit'] = "This assessment is recommended based on your query requirements."
+    
+    if 'assessment_length' in item:
+        rec['assessment_length'] = item['assessment_length']
+    else:
+        # Try to get from retrieved assessments by matching URL
+        matching_assessment = by_url.get(rec['assessment_url'])
+        if matching_assessment and matching_assessment.get('assessment_length'):
+            rec['assessment_length'] = matching_assessment['assessment_length']
+        else:
+            rec['assessment_length'] = "Not specified"
+    
+    return rec
+
+
+def _fallback_recommendation(item: dict) -> dict:
+    """Build a recommendation directly from a retrieved assessment."""
+    return {
+        'assessment_name': item['assessment_name'],
+        'assessment_url': item['assessment_url'],
+        'description': item.get('assessment_description', ''),
+        'why_great_fit': f"This assessment is recommended based on your query requirements. It measures {item.get('assessment_type', 'relevant skills')} that align with your hiring needs.",
+        'assessment_length': item.get('assessment_length', 'Not specified')
+    }
+
+
+def _fallback_recommendations(retrieved_assessments: list) -> list:
+    """Return the top 5-10 retrieved assessments when the LLM step fails."""
+    print("Falling back to top 5-10 retrieved assessments...")
+    # Take at least 5, up to 10
+    num_to_take = min(max(5, len(retrieved_assessments)), 10)
+    return [_fallback_recommendation(item) for item in retrieved_assessments[:num_to_take]]
+
+
+def _padding_recommendations(validated_recommendations: list, retrieved_assessments: list) -> list:
+    """Return retrieved assessments needed to bring the result up to 5 items."""
+    padding = []
+    if len(validated_recommendations) < 5:
+        # If we have less than 5, add more from retrieved assessments
+        print(f"Only {len(validated_recommendations)} recommendations found. Adding more from retrieved assessments...")
+        seen_urls = {rec['assessment_url'] for rec in validated_recommendations}
+        for item in retrieved_assessments:
+            if len(validated_recommendations) + len(padding) >= 5:
+                break
+            # Check if already in recommendations
+            if item.get('assessment_url') not in seen_urls:
+                seen_urls.add(item.get('assessment_url'))
+                padding.append(_fallback_recommendation(item))
+    return padding
+
+
+def _generate_recommendations(query: str) -> tuple:
+    """Run the full retrieval and LLM re-ranking pipeline for a query; returns _rerank's result."""
+    # Process query - extract text if URL is provided
+    query = process_query(query)
+    client = _groq_client()
+    retrieved_assessments = _retrieve(query)
+    return _rerank(client, query, retrieved_assessments)
+
+
+def _rerank(client, query: str, retrieved_assessments: list) -> tuple:
+    """
+    Ask the LLM to select and explain 5-10 of the retrieved assessments.
+    
+    Returns (recommendations, fallback), where fallback is True when the
+    LLM answer could not be used and the top retrieved assessments were
+    returned instead. Fallback results must not be cached.
+    """
+    prompt = _build_prompt(query, retrieved_assessments)
     
     print("Calling Groq API...")
     # Make API call to Groq
     try:
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model="llama-3.1-8b-instant",
-            temperature=0.3,
-            max_tokens=4000
-        )
-        
+        chat_completion = client.chat.completions.create(**_completion_kwargs(prompt))
         response_text = chat_completion.choices[0].message.content.strip()
-        
-        # Try to extract JSON from the response
-        # Sometimes the model includes markdown code blocks
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
-        # Parse JSON response
-        try:
-            recommendations = json.loads(response_text)
-            
-            # Validate structure
-            if not isinstance(recommendations, list):
-                raise ValueError("Response is not a list")
-            
-            # Ensure each item has required keys and extract all fields
-            validated_recommendations = []
-            for item in recommendations:
-                if isinstance(item, dict) and 'assessment_name' in item and 'assessment_url' in item:
-                    # Build recommendation with all available fields
-                    rec = {
-                        'assessment_name': item['assessment_name'],
-                        'assessment_url': item['assessment_url']
-                    }
-                    
-                    # Add optional fields if provided by the model
-                    if 'description' in item:
-                        rec['description'] = item['description']
-                    elif 'assessment_description' in item:
-                        rec['description'] = item['assessment_description']
-                    else:
-                        # Try to get from retrieved assessments by matching URL
-                        matching_assessment = next(
-                            (a for a in retrieved_assessments if a.get('assessment_url') == rec['assessment_url']),
-                            None
-                        )
-                        if matching_assessment and matching_assessment.get('assessment_description'):
-                            rec['description'] = matching_assessment['assessment_description']
-                        else:
-                            rec['description'] = ""
-                    
-                    if 'why_great_fit' in item:
-                        rec['why_great_fit'] = item['why_great_fit']
-                    else:
-                        rec['why_great_fit'] = "This assessment is recommended based on your query requirements."
-                    
-                    if 'assessment_length' in item:
-                        rec['assessment_length'] = item['assessment_length']
-                    else:
-                        # Try to get from retrieved assessments by matching URL
-                        matching_assessment = next(
-                            (a for a in retrieved_assessments if a.get('assessment_url') == rec['assessment_url']),
-                            None
-                        )
-                        if matching_assessment and matching_assessment.get('assessment_length'):
-                            rec['assessment_length'] = matching_assessment['assessment_length']
-                        else:
-                            rec['assessment_length'] = "Not specified"
-                    
-                    validated_recommendations.append(rec)
-            
-            print(f"Successfully retrieved {len(validated_recommendations)} recommendations.")
-            
-            # Ensure minimum 5 and maximum 10 recommendations
-            if len(validated_recommendations) < 5:
-                # If we have less than 5, add more from retrieved assessments
-                print(f"Only {len(validated_recommendations)} recommendations found. Adding more from retrieved assessments...")
-                for item in retrieved_assessments:
-                    if len(validated_recommendations) >= 5:
-                        break
-                    # Check if already in recommendations
-                    if not any(rec['assessment_url'] == item.get('assessment_url') for rec in validated_recommendations):
-                        fallback_rec = {
-                            'assessment_name': item['assessment_name'],
-                            'assessment_url': item['assessment_url'],
-                            'description': item.get('assessment_description', ''),
-                            'why_great_fit': f"This assessment is recommended based on your query requirements. It measures {item.get('assessment_type', 'relevant skills')} that align with your hiring needs.",
-                            'assessment_length': item.get('assessment_length', 'Not specified')
-                        }
-                        validated_recommendations.append(fallback_rec)
-            
-            # Limit to maximum 10
-            if len(validated_recommendations) > 10:
-                validated_recommendations = validated_recommendations[:10]
-                print(f"Limited to top 10 recommendations.")
-            
-            return validated_recommendations
-            
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON response: {e}")
-            print(f"Response text: {response_text[:500]}")
-            # Fallback: return top 5-10 from retrieved assessments with all available info
-            print("Falling back to top 5-10 retrieved assessments...")
-            fallback_recommendations = []
-            # Take at least 5, up to 10
-            num_to_take = min(max(5, len(retrieved_assessments)), 10)
-            for item in retrieved_assessments[:num_to_take]:
-                fallback_rec = {
-                    'assessment_name': item['assessment_name'],
-                    'assessment_url': item['assessment_url'],
-                    'description': item.get('assessment_description', ''),
-                    'why_great_fit': f"This assessment is recommended based on your query requirements. It measures {item.get('assessment_type', 'relevant skills')} that align with your hiring needs.",
-                    'assessment_length': item.get('assessment_length', 'Not specified')
-                }
-                fallback_recommendations.append(fallback_rec)
-            return fallback_recommendations
-            
+        return _parse_recommendations(response_text, retrieved_assessments)
     except Exception as e:
         print(f"Error calling Groq API: {e}")
         # Fallback: return top 5-10 from retrieved assessments with all available info
-        print("Falling back to top 5-10 retrieved assessments...")
-        fallback_recommendations = []
-        # Take at least 5, up to 10
-        num_to_take = min(max(5, len(retrieved_assessments)), 10)
-        for item in retrieved_assessments[:num_to_take]:
-            fallback_rec = {
-                'assessment_name': item['assessment_name'],
-                'assessment_url': item['assessment_url'],
-                'description': item.get('assessment_description', ''),
-                'why_great_fit': f"This assessment is recommended based on your query requirements. It measures {item.get('assessment_type', 'relevant skills')} that align with your hiring needs.",
-                'assessment_length': item.get('assessment_length', 'Not specified')
-            }
-            fallback_recommendations.append(fallback_rec)
-        return fallback_recommendations
+        return _fallback_recommendations(retrieved_assessments), True
 
+
+def _parse_recommendations(response_text: str, retrieved_assessments: list) -> tuple:
+    """
+    Turn the model's JSON answer into 5-10 validated recommendations.
+    
+    Returns (recommendations, fallback) like _rerank: falls back to the
+    retrieved assessments if the answer is not valid JSON; raises
+    ValueError if it is valid JSON but not a list.
+    """
+    # Try to extract JSON from the response
+    # Sometimes the model includes markdown code blocks
+    response_text = _extract_json_text(response_text)
+    
+    # Parse JSON response
+    try:
+        recommendations = orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
+        print(f"Error parsing JSON response: {e}")
+        print(f"Response text: {response_text[:500]}")
+        # Fallback: return top 5-10 from retrieved assessments with all available info
+        return _fallback_recommendations(retrieved_assessments), True
+    
+    # Validate structure
+    if not isinstance(recommendations, list):
+        raise ValueError("Response is not a list")
+    
+    # Ensure each item has required keys and extract all fields
+    by_url = {a.get('assessment_url'): a for a in retrieved_assessments}
+    validated_recommendations = []
+    for item in recommendations:
+        rec = _validate_recommendation(item, by_url)
+        if rec is not None:
+            validated_recommendations.append(rec)
+    
+    print(f"Successfully retrieved {len(validated_recommendations)} recommendations.")
+    
+    # Ensure minimum 5 and maximum 10 recommendations
+    validated_recommendations += _padding_recommendations(validated_recommendations, retrieved_assessments)
+    
+    # Limit to maximum 10
+    if len(validated_recommendations) > 10:
+        validated_recommendations = validated_recommendations[:10]
+        print(f"Limited to top 10 recommendations.")
+    
+    return validated_recommendations, False
+
+
+def _iter_json_objects(chunks):
+    """
+    Yield top-level JSON objects from a stream of text chunks.
+    
+    Tracks brace depth and string state across chunks so each object in
+    the model's JSON array is decoded as soon as its closing brace
+    arrives. Malformed objects are skipped.
+    """
+    buffer = []
+    depth = 0
+    in_string = False
+    escaped = False
+    for chunk in chunks:
+        for char in chunk:
+            if depth:
+                buffer.append(char)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = depth > 0
+            elif char == '{':
+                if depth == 0:
+                    buffer = [char]
+                depth += 1
+            elif char == '}' and depth:
+                depth -= 1
+                if depth == 0:
+                    try:
+                        yield orjson.loads(''.join(buffer))
+                    except orjson.JSONDecodeError:
+                        pass
+
+
+def stream_recommendations(query: str):
+    """
+    Yield assessment recommendations as the LLM produces them.
+    
+    Streams the Groq completion and validates each recommendation as soon
+    as its JSON object is complete, so callers can display the first
+    result before generation finishes. The same 5-10 item limits and
+    fallbacks as get_recommendations apply.
+    
+    Args:
+        query: User's hiring query, job description text, or URL containing a JD
+        
+    Yields:
+        dict: Recommendation with the same keys as get_recommendations items
+    """
+    key = _cache_key(query)
+    cached = _cache_get(key)
+    if cached is not None:
+        yield from cached
+        return
+    
+    # Process query - extract text if URL is provided
+    query = process_query(query)
+    client = _groq_client()
+    retrieved_assessments = _retrieve(query)
+    prompt = _build_prompt(query, retrieved_assessments)
+    
+    print("Calling Groq API (streaming)...")
+    by_url = {a.get('assessment_url'): a for a in retrieved_assessments}
+    validated_recommendations = []
+    failed = False
+    try:
+        chat_completion = client.chat.completions.create(stream=True, **_completion_kwargs(prompt))
+        deltas = (chunk.choices[0].delta.content or '' for chunk in chat_completion if chunk.choices)
+        for item in _iter_json_objects(deltas):
+            rec = _validate_recommendation(item, by_url)
+            if rec is None:
+                continue
+            validated_recommendations.append(rec)
+            yield rec
+            # Limit to maximum 10
+            if len(validated_recommendations) >= 10:
+                break
+    except Exception as e:
+        print(f"Error calling Groq API: {e}")
+        # A stream cut off mid-answer is still padded, but never cached
+        failed = True
+        if not validated_recommendations:
+            validated_recommendations = _fallback_recommendations(retrieved_assessments)
+            yield from validated_recommendations
+            return
+    
+    # No usable objects in the answer: same fallback as get_recommendations,
+    # and like it, not cached
+    if not validated_recommendations:
+        yield from _fallback_recommendations(retrieved_assessments)
+        return
+    
+    # Ensure minimum 5 recommendations
+    padding = _padding_recommendations(validated_recommendations, retrieved_assessments)
+    yield from padding
+    validated_recommendations += padding
+    
+    if not failed:
+        _cache_put(key, validated_recommendations)
@@ -5,9 +5,12 @@ Calculates Mean Recall@10 on labeled train set.
 """
 
 import pandas as pd
+import numpy as np
+import csv
 import os
-from engine import get_recommendations
-from typing import List, Set
+from tqdm import tqdm
+from engine import get_recommendations_batch, load_result_cache, save_result_cache
+from typing import Dict, List, Optional, Set
 
 
 def calculate_recall_at_k(recommended_urls: List[str], relevant_urls: Set[str], k: int = 10) -> float:
@@ -22,19 +25,72 @@ def calculate_recall_at_k(recommended_urls: List[str], relevant_urls: Set[str],
     Returns:
         float: Recall@K score (0.0 to 1.0)
     """
-    if not relevant_urls:
-        return 0.0
-    
-    # Take top k recommendations
-    top_k = recommended_urls[:k]
+    # Single-query form of calculate_recall_at_k_batch
+    url_to_id = {url: i for i, url in enumerate(relevant_urls)}
+    return float(calculate_recall_at_k_batch([recommended_urls], [relevant_urls], url_to_id, k)[0])
+
+
+def _count_hits(recommended: List[List[str]], relevant: List[Set[str]],
+                url_to_id: Dict[str, int], k: Optional[int] = 10) -> np.ndarray:
+    """
+    Count relevant URLs among the top k recommendations of every query.
     
-    # Count how many relevant items are in top k
-    relevant_in_top_k = sum(1 for url in top_k if url in relevant_urls)
+    Each (query, url) pair is encoded as the integer ``row * width + url_id``
+    so all relevant sets can be searched at once with ``np.searchsorted``.
     
-    # Calculate recall
-    recall = relevant_in_top_k / len(relevant_urls)
+    Args:
+        recommended: Recommended assessment URLs per query
+        relevant: Relevant assessment URLs per query (ground truth)
+        url_to_id: Mapping from known assessment URLs to integer ids
+        k: Number of top recommendations to consider (None for all)
+        
+    Returns:
+        np.ndarray: Number of relevant URLs found per query
+    """
+    n = len(recommended)
+    width = len(url_to_id) + 1
+    top = [urls[:k] for urls in recommended]
+    
+    # (N, k) matrix of recommended ids, -1 for unknown URLs and padding
+    cols = max((len(urls) for urls in top), default=0)
+    rec_ids = np.full((n, cols), -1, dtype=np.int64)
+    for row, urls in enumerate(top):
+        rec_ids[row, :len(urls)] = np.fromiter((url_to_id.get(u, -1) for u in urls),
+                                               dtype=np.int64, count=len(urls))
+    
+    # Sorted, row-offset keys of every relevant URL
+    rel_keys = np.concatenate([
+        row * width + np.sort(np.fromiter((url_to_id[u] for u in urls), dtype=np.int64, count=len(urls)))
+        for row, urls in enumerate(relevant)
+    ] + [np.empty(0, dtype=np.int64)])
+    
+    if not len(rel_keys):
+        return np.zeros(n, dtype=np.int64)
+    
+    rec_keys = np.arange(n, dtype=np.int64)[:, None] * width + rec_ids
+    pos = np.minimum(np.searchsorted(rel_keys, rec_keys), len(rel_keys) - 1)
+    found = (rel_keys[pos] == rec_keys) & (rec_ids >= 0)
+    
+    return found.sum(axis=1)
+
+
+def calculate_recall_at_k_batch(recommended: List[List[str]], relevant: List[Set[str]],
+                                url_to_id: Dict[str, int], k: int = 10) -> np.ndarray:
+    """
+    Calculate Recall@K for many queries in one vectorized pass.
     
-    return recall
+    Args:
+        recommended: Recommended assessment URLs per query
+        relevant: Relevant assessment URLs per query (ground truth)
+        url_to_id: Mapping from known assessment URLs to integer ids
+        k: Number of top recommendations to consider
+        
+    Returns:
+        np.ndarray: Recall@K score per query (0.0 to 1.0)
+    """
+    hits = _count_hits(recommended, relevant, url_to_id, k)
+    counts = np.fromiter((len(urls) for urls in relevant), dtype=np.float64, count=len(relevant))
+    return np.divide(hits, counts, out=np.zeros_like(counts), where=counts > 0)
 
 
 def evaluate_on_train_set(train_file: str = "train_set.csv"):
@@ -59,9 +115,15 @@ def evaluate_on_train_set(train_file: str = "train_set.csv"):
         "labeled_train_set.xlsx"
     ]
     
+    # One directory listing covers every bare file name
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
     train_file_path = None
     for f in possible_files:
-        if os.path.exists(f):
+        if not f:
+            continue
+        if (f in present) if not os.path.dirname(f) else os.path.exists(f):
             train_file_path = f
             break
     
@@ -76,17 +138,15 @@ def evaluate_on_train_set(train_file: str = "train_set.csv"):
     if train_file_path.endswith('.xlsx'):
         df = pd.read_excel(train_file_path)
     else:
-        df = pd.read_csv(train_file_path)
+        # The default parser handles quoted multi-line job descriptions, which
+        # the pyarrow engine rejects once a file spans several Arrow blocks;
+        # columns still come back as Arrow arrays
+        df = pd.read_csv(train_file_path, dtype_backend='pyarrow')
     
     # Find query and url columns
-    query_col = None
-    url_col = None
-    
-    for col in df.columns:
-        if 'query' in col.lower():
-            query_col = col
-        if 'assessment' in col.lower() and 'url' in col.lower():
-            url_col = col
+    lowered = {col: str(col).lower() for col in df.columns}
+    query_col = next((col for col, name in lowered.items() if 'query' in name), None)
+    url_col = next((col for col, name in lowered.items() if 'assessment' in name and 'url' in name), None)
     
     if not query_col or not url_col:
         print(f"❌ Required columns not found.")
@@ -94,66 +154,63 @@ def evaluate_on_train_set(train_file: str = "train_set.csv"):
         print(f"   Expected: Query column and Assessment_url column")
         return None
     
-    # Group by query to get relevant URLs for each query
-    query_groups = df.groupby(query_col)[url_col].apply(set).to_dict()
+    # Group by query to get relevant URLs for each query; one loop over the
+    # unique pairs is cheaper than groupby().apply(set) per-group callbacks
+    pairs = df[[query_col, url_col]].dropna().drop_duplicates()
+    query_groups = {}
+    for query, url in zip(pairs[query_col].tolist(), pairs[url_col].tolist()):
+        query_groups.setdefault(query, set()).add(url)
+    url_to_id = {url: i for i, url in enumerate(df[url_col].unique())}
     
     print(f"Found {len(query_groups)} unique queries\n")
     
-    # Evaluate each query
-    results = []
-    
-    for idx, (query, relevant_urls) in enumerate(query_groups.items(), 1):
-        print(f"[{idx}/{len(query_groups)}] Processing: {query[:60]}...")
-        
-        try:
-            # Get recommendations
-            recommendations = get_recommendations(query)
-            
-            # Extract URLs from recommendations
-            recommended_urls = [rec.get('assessment_url', rec.get('url', '')) for rec in recommendations]
-            
-            # Calculate Recall@10
-            recall_10 = calculate_recall_at_k(recommended_urls, relevant_urls, k=10)
-            
-            # Count relevant in recommendations
-            relevant_found = sum(1 for url in recommended_urls if url in relevant_urls)
-            
-            results.append({
-                'Query': query,
-                'Relevant_Count': len(relevant_urls),
-                'Recommended_Count': len(recommended_urls),
-                'Relevant_Found': relevant_found,
-                'Recall@10': recall_10
-            })
-            
-            print(f"   Relevant: {len(relevant_urls)}, Found: {relevant_found}, Recall@10: {recall_10:.3f}")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results.append({
-                'Query': query,
-                'Relevant_Count': len(relevant_urls),
-                'Recommended_Count': 0,
-                'Relevant_Found': 0,
-                'Recall@10': 0.0
-            })
+    # Get recommendations for all queries in one batched engine call
+    queries = list(query_groups.keys())
+    load_result_cache()
+    try:
+        # Advance the bar as each query's LLM re-rank finishes
+        with tqdm(total=len(queries), desc="Getting recommendations", unit="query") as progress:
+            batch_recommendations = get_recommendations_batch(
+                queries, on_result=lambda i, result: progress.update()
+            )
+        save_result_cache()
+    except Exception as e:
+        # Score every query as having no recommendations
+        print(f"❌ Error: {e}")
+        batch_recommendations = [[] for _ in queries]
+    
+    # Extract URLs from recommendations; a query that failed is scored as
+    # having no recommendations
+    recommended = []
+    for query, recommendations in zip(queries, batch_recommendations):
+        if isinstance(recommendations, Exception):
+            print(f"❌ Error processing query '{query[:50]}...': {recommendations}")
+            recommendations = []
+        recommended.append([rec.get('assessment_url', rec.get('url', '')) for rec in recommendations])
+    relevant = [query_groups[query] for query in queries]
+    
+    # Score all queries at once
+    recalls = calculate_recall_at_k_batch(recommended, relevant, url_to_id, k=10)
+    relevant_found = _count_hits(recommended, relevant, url_to_id, k=None)
+    
+    # Write per-query results
+    with open("evaluation_results.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Query', 'Relevant_Count', 'Recommended_Count', 'Relevant_Found', 'Recall@10'])
+        writer.writerows(
+            (query, len(relevant[idx]), len(recommended[idx]), int(relevant_found[idx]), float(recalls[idx]))
+            for idx, query in enumerate(queries)
+        )
     
     # Calculate Mean Recall@10
-    df_results = pd.DataFrame(results)
-    mean_recall_10 = df_results['Recall@10'].mean()
+    mean_recall_10 = recalls.mean() if len(recalls) else 0.0
     
     print("\n" + "=" * 60)
     print("EVALUATION RESULTS")
     print("=" * 60)
-    print("\nDetailed Results:")
-    print(df_results.to_string(index=False))
-    
-    print(f"\n{'='*60}")
     print(f"Mean Recall@10: {mean_recall_10:.4f}")
     print(f"{'='*60}\n")
     
-    # Save results
-    df_results.to_csv("evaluation_results.csv", index=False)
     print("Results saved to: evaluation_results.csv")
     
     return mean_recall_10
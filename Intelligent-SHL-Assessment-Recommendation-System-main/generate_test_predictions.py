@@ -5,8 +5,9 @@ This script generates predictions for the test set in the required CSV format.
 """
 
 import pandas as pd
+import csv
 import os
-from engine import get_recommendations
+from engine import get_recommendations_batch, load_result_cache, save_result_cache
 
 
 def generate_predictions_csv(test_file_path: str, output_file: str = "test_predictions.csv"):
@@ -16,12 +17,18 @@ def generate_predictions_csv(test_file_path: str, output_file: str = "test_predi
     Args:
         test_file_path: Path to test set file (CSV or Excel with 'Query' column)
         output_file: Output CSV file path
+        
+    Returns:
+        int: Number of prediction rows written
     """
     # Read test set
     if test_file_path.endswith('.xlsx'):
         df_test = pd.read_excel(test_file_path)
     else:
-        df_test = pd.read_csv(test_file_path)
+        # The default parser handles quoted multi-line job descriptions, which
+        # the pyarrow engine rejects once a file spans several Arrow blocks;
+        # columns still come back as Arrow arrays
+        df_test = pd.read_csv(test_file_path, dtype_backend='pyarrow')
     
     # Check if 'Query' column exists
     if 'Query' not in df_test.columns:
@@ -39,46 +46,50 @@ def generate_predictions_csv(test_file_path: str, output_file: str = "test_predi
     
     print(f"Found {len(df_test)} test queries.")
     
-    # Generate predictions
-    results = []
+    # Generate predictions for all queries in one batched engine call
+    queries = df_test['Query'].to_numpy()
+    load_result_cache()
+    try:
+        batch_recommendations = get_recommendations_batch(list(queries))
+        save_result_cache()
+    except Exception as e:
+        print(f"Error processing queries: {e}")
+        batch_recommendations = [None] * len(queries)
+    
+    total_rows = 0
+    unique_queries = set()
     
-    for idx, row in df_test.iterrows():
-        query = row['Query']
-        print(f"\n[{idx + 1}/{len(df_test)}] Processing: {query[:50]}...")
+    # Write rows as they are produced instead of building a DataFrame
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Query', 'Assessment_url'])
         
-        try:
-            # Get recommendations
-            recommendations = get_recommendations(query)
+        for idx, (query, recommendations) in enumerate(zip(queries, batch_recommendations)):
+            print(f"\n[{idx + 1}/{len(queries)}] Processing: {query[:50]}...")
+            unique_queries.add(query)
+            
+            if isinstance(recommendations, Exception):
+                print(f"  Error processing query: {recommendations}")
+                recommendations = None
+            
+            if recommendations is None:
+                # Add empty result to maintain format
+                writer.writerow((query, ''))
+                total_rows += 1
+                continue
             
             # Add each recommendation to results
-            for rec in recommendations:
-                # Handle both 'url' and 'assessment_url' for compatibility
-                url = rec.get('assessment_url', rec.get('url', ''))
-                results.append({
-                    'Query': query,
-                    'Assessment_url': url
-                })
+            # Handle both 'url' and 'assessment_url' for compatibility
+            writer.writerows((query, rec.get('assessment_url', rec.get('url', ''))) for rec in recommendations)
+            total_rows += len(recommendations)
             
             print(f"  Generated {len(recommendations)} recommendations.")
-            
-        except Exception as e:
-            print(f"  Error processing query: {e}")
-            # Add empty result to maintain format
-            results.append({
-                'Query': query,
-                'Assessment_url': ''
-            })
-    
-    # Create DataFrame
-    df_results = pd.DataFrame(results)
     
-    # Save to CSV
-    df_results.to_csv(output_file, index=False)
     print(f"\n✅ Predictions saved to: {output_file}")
-    print(f"Total rows: {len(df_results)}")
-    print(f"Unique queries: {df_results['Query'].nunique()}")
+    print(f"Total rows: {total_rows}")
+    print(f"Unique queries: {len(unique_queries)}")
     
-    return df_results
+    return total_rows
 
 
 if __name__ == "__main__":
@@ -90,8 +101,10 @@ if __name__ == "__main__":
     else:
         # Default test file names to try
         test_file = None
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries}
         for filename in ['test_set.csv', 'test_set.xlsx', 'unlabeled_test_set.csv', 'unlabeled_test_set.xlsx']:
-            if os.path.exists(filename):
+            if filename in present:
                 test_file = filename
                 break
         
@@ -4,17 +4,38 @@ FastAPI Backend Server for SHL Assessment Recommendation System
 This module provides a REST API endpoint for the recommendation engine.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import threading
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List
-from engine import get_recommendations
+from functools import lru_cache
+from typing import List, Optional
+from url_extractor import is_url
+
+# Concurrent /recommend requests are coalesced into one engine batch of up
+# to MAX_BATCH queries, waiting at most MAX_WAIT_MS for the batch to fill.
+# MAX_BATCH matches the engine's RERANK_WORKERS default so a batch needs a
+# single round of LLM calls
+MAX_BATCH = 16
+MAX_WAIT_MS = 5
+
+# Largest number of queries accepted by /recommend_batch
+MAX_BATCH_QUERIES = 50
+
+# Serialized /recommend bodies per query; like the engine's result cache,
+# only LLM-ranked answers are stored, never fallbacks
+_response_cache = TTLCache(maxsize=2048, ttl=3600)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="SHL Assessment Recommendation API",
     description="API for intelligent SHL assessment recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware to allow Streamlit frontend to access the API
@@ -48,13 +69,141 @@ class RecommendationResponse(BaseModel):
     recommendations: List[RecommendationItem]
 
 
+class BatchRecommendationRequest(BaseModel):
+    """Request model for batch recommendation endpoint."""
+    queries: List[str]
+
+
+class BatchRecommendationResult(RecommendationResponse):
+    """Result for one query of a batch; error is set if that query failed."""
+    error: Optional[str] = None
+
+
+class BatchRecommendationResponse(BaseModel):
+    """Response model for batch recommendation endpoint."""
+    results: List[BatchRecommendationResult]
+
+
+def _to_item_dict(rec: dict) -> dict:
+    """Map an engine recommendation to the API item fields."""
+    # Map assessment_url to url to match API specification
+    return {
+        'assessment_name': rec.get('assessment_name', ''),
+        'url': rec.get('assessment_url', rec.get('url', '')),
+        'description': rec.get('description', ''),
+        'why_great_fit': rec.get('why_great_fit', ''),
+        'assessment_length': rec.get('assessment_length', '')
+    }
+
+
+@lru_cache(maxsize=1)
+def _engine():
+    """
+    Import the recommendation engine on first use.
+    
+    engine pulls in torch, sentence-transformers, FAISS and Groq, so
+    importing it lazily lets the server bind and answer /health at once.
+    """
+    import engine
+    return engine
+
+
+def _recommend_batch_sync(queries: List[str], on_result=None) -> list:
+    """Run one engine batch; called from a worker thread."""
+    return _engine().get_recommendations_batch(queries, on_result=on_result)
+
+
+_batch_queue = None
+_batch_tasks = set()
+
+
+def _resolve(future: asyncio.Future, result):
+    """Complete a queued request's future with its recommendations or error."""
+    if future.done():
+        return
+    if isinstance(result, Exception):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+async def _run_batch(batch: list):
+    """
+    Run one engine batch in a worker thread and resolve its futures.
+    
+    Each future is resolved as soon as its own query finishes, and a query
+    that fails only fails its own request.
+    """
+    loop = asyncio.get_running_loop()
+    
+    def on_result(i, result):
+        loop.call_soon_threadsafe(_resolve, batch[i][1], result)
+    
+    try:
+        await asyncio.to_thread(_recommend_batch_sync, [query for query, _ in batch], on_result)
+    except Exception as e:
+        # Setup errors (missing vector store or API key) affect every query
+        for _, future in batch:
+            _resolve(future, e)
+
+
+async def _batch_worker():
+    """Collect queued queries into batches and dispatch them to the engine."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _batch_queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # Dispatch without waiting so the next batch can start filling
+        task = asyncio.create_task(_run_batch(batch))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+
+
+async def _recommend_batched(query: str) -> list:
+    """Queue a query for the next engine batch and wait for its result."""
+    future = asyncio.get_running_loop().create_future()
+    if is_url(query):
+        # URL queries wait on a page fetch, so they run alone rather than
+        # holding up a shared batch of plain-text queries
+        await _run_batch([(query, future)])
+    else:
+        await _batch_queue.put((query, future))
+    return await future
+
+
+@app.on_event("startup")
+async def warmup_engine():
+    """Load the engine, models and vector store in the background."""
+    threading.Thread(target=lambda: _engine().warmup(), name="engine-warmup", daemon=True).start()
+
+
+@app.on_event("startup")
+async def start_batcher():
+    """Start the background task that batches /recommend queries."""
+    global _batch_queue
+    _batch_queue = asyncio.Queue()
+    task = asyncio.create_task(_batch_worker())
+    _batch_tasks.add(task)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
 
 
-@app.post("/recommend", response_model=RecommendationResponse)
+# Responses are built from trusted engine output and serialized by orjson
+# directly; the model is kept for the OpenAPI schema only
+@app.post("/recommend", response_model=None, responses={200: {"model": RecommendationResponse}})
 async def recommend(request: RecommendationRequest):
     """
     Get assessment recommendations based on user query.
@@ -68,27 +217,64 @@ async def recommend(request: RecommendationRequest):
     if not request.query or not request.query.strip():
         raise HTTPException(status_code=400, detail="Query cannot be empty")
     
+    query = request.query.strip()
+    payload = _response_cache.get(query)
+    if payload is not None:
+        return Response(content=payload, media_type="application/json")
+    
     try:
         # Get recommendations from the engine
-        recommendations = get_recommendations(request.query.strip())
+        recommendations = await _recommend_batched(query)
         
-        # Convert to response model - map assessment_url to url for API spec
-        recommendation_items = []
-        for rec in recommendations:
-            # Map assessment_url to url to match API specification
-            item_dict = {
-                'assessment_name': rec.get('assessment_name', ''),
-                'url': rec.get('assessment_url', rec.get('url', '')),
-                'description': rec.get('description', ''),
-                'why_great_fit': rec.get('why_great_fit', ''),
-                'assessment_length': rec.get('assessment_length', '')
-            }
-            recommendation_items.append(RecommendationItem(**item_dict))
+        # Convert to response fields - map assessment_url to url for API spec
+        payload = orjson.dumps({
+            'query': query,
+            'recommendations': [_to_item_dict(rec) for rec in recommendations]
+        })
+        if _engine().is_cached(query):
+            _response_cache[query] = payload
+        return Response(content=payload, media_type="application/json")
+        
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@app.post("/recommend_batch", response_model=None, responses={200: {"model": BatchRecommendationResponse}})
+async def recommend_batch(request: BatchRecommendationRequest):
+    """
+    Get assessment recommendations for several queries in one call.
+    
+    Args:
+        request: BatchRecommendationRequest containing the queries
         
-        return RecommendationResponse(
-            query=request.query.strip(),
-            recommendations=recommendation_items
-        )
+    Returns:
+        BatchRecommendationResponse with one result per query, in order;
+        a query that failed has no recommendations and its error set
+    """
+    queries = [query.strip() if query else '' for query in request.queries]
+    if not queries or not all(queries):
+        raise HTTPException(status_code=400, detail="Queries cannot be empty")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_QUERIES} queries per request")
+    
+    try:
+        batch_recommendations = await asyncio.to_thread(_recommend_batch_sync, queries)
+        results = []
+        for query, recommendations in zip(queries, batch_recommendations):
+            # A failed query (e.g. an unreachable URL) only fails its own result
+            if isinstance(recommendations, Exception):
+                results.append({'query': query, 'recommendations': [], 'error': str(recommendations)})
+            else:
+                results.append({
+                    'query': query,
+                    'recommendations': [_to_item_dict(rec) for rec in recommendations],
+                    'error': None
+                })
+        return {'results': results}
         
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -98,6 +284,43 @@ async def recommend(request: RecommendationRequest):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post("/recommend/stream")
+def recommend_stream(request: RecommendationRequest):
+    """
+    Stream assessment recommendations as newline-delimited JSON.
+    
+    Each line is one RecommendationItem, sent as soon as the LLM finishes
+    generating it.
+    
+    Args:
+        request: RecommendationRequest containing the user's query
+        
+    Returns:
+        StreamingResponse yielding one JSON object per line
+    """
+    if not request.query or not request.query.strip():
+        raise HTTPException(status_code=400, detail="Query cannot be empty")
+    
+    recommendations = _engine().stream_recommendations(request.query.strip())
+    
+    # Produce the first item eagerly so setup errors still map to HTTP errors
+    try:
+        first = next(recommendations, None)
+    except (FileNotFoundError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    def ndjson_lines():
+        if first is None:
+            return
+        yield orjson.dumps(_to_item_dict(first)) + b"\n"
+        for rec in recommendations:
+            yield orjson.dumps(_to_item_dict(rec)) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8000)
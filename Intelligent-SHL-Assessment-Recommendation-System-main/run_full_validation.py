@@ -4,16 +4,45 @@ Full System Validation Script
 This script performs end-to-end validation of the SHL Assessment Recommendation System.
 """
 
+import ast
 import os
 import sys
 import subprocess
-import json
+import orjson
+from importlib.util import find_spec
 from pathlib import Path
 
 
-def check_file_exists(filepath: str, description: str) -> bool:
-    """Check if a file exists."""
-    exists = os.path.exists(filepath)
+def _list_dir(directory: str) -> set:
+    """Return the entry names in a directory (empty if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def check_file_exists(filepath: str, description: str, listings: dict = None) -> bool:
+    """
+    Check if a file exists.
+    
+    Args:
+        filepath: Path to check
+        description: Label printed next to the result
+        listings: Optional cache of directory listings shared across calls,
+            so each directory is read once instead of stat-ing every file
+            
+    Returns:
+        bool: True if the file exists
+    """
+    if listings is None:
+        exists = os.path.exists(filepath)
+    else:
+        directory, name = os.path.split(filepath)
+        directory = directory or '.'
+        if directory not in listings:
+            listings[directory] = _list_dir(directory)
+        exists = name in listings[directory]
     status = "✅" if exists else "❌"
     print(f"{status} {description}: {filepath}")
     return exists
@@ -39,12 +68,16 @@ def check_python_imports():
         'dotenv'
     ]
     
+    # Distribution names that differ from their import name
+    import_names = {'beautifulsoup4': 'bs4'}
+    
     all_ok = True
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
+        # find_spec locates the package without running its (heavy) import
+        module = import_names.get(package, package.replace('-', '_'))
+        if find_spec(module) is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             print(f"❌ {package} - NOT INSTALLED")
             all_ok = False
     
@@ -60,12 +93,13 @@ def check_data_files():
     required_files = [
         ('data/shl_assessments.csv', 'Assessment data CSV'),
         ('data/faiss_index.bin', 'FAISS vector index'),
-        ('data/index_to_data.pkl', 'Index to data mapping'),
+        ('data/index_to_data.arrow', 'Index to data mapping'),
     ]
     
     all_exist = True
+    listings = {}
     for filepath, description in required_files:
-        if not check_file_exists(filepath, description):
+        if not check_file_exists(filepath, description, listings):
             all_exist = False
     
     return all_exist
@@ -93,8 +127,9 @@ def check_code_files():
     ]
     
     all_exist = True
+    listings = {}
     for filepath, description in required_files:
-        if not check_file_exists(filepath, description):
+        if not check_file_exists(filepath, description, listings):
             all_exist = False
     
     return all_exist
@@ -107,17 +142,41 @@ def validate_api_structure():
     print("=" * 60)
     
     try:
-        with open('main.py', 'r') as f:
-            content = f.read()
+        tree = ast.parse(Path('main.py').read_bytes())
+        
+        # Collect the module's structure in a single walk
+        fastapi_names = set()
+        routes = set()
+        classes = {}
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module == 'fastapi':
+                fastapi_names.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ClassDef):
+                classes[node.name] = {
+                    stmt.target.id for stmt in node.body
+                    if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name)
+                }
+            elif isinstance(node, ast.Name):
+                names.add(node.id)
+            
+            # Route decorators such as @app.get("/health")
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                for decorator in node.decorator_list:
+                    if (isinstance(decorator, ast.Call)
+                            and isinstance(decorator.func, ast.Attribute)
+                            and decorator.args
+                            and isinstance(decorator.args[0], ast.Constant)):
+                        routes.add((decorator.func.attr, decorator.args[0].value))
         
         checks = {
-            "FastAPI import": "from fastapi import" in content,
-            "Health endpoint": "@app.get(\"/health\")" in content or '@app.get("/health")' in content,
-            "Recommend endpoint": "@app.post(\"/recommend\")" in content or '@app.post("/recommend")' in content,
-            "CORS middleware": "CORSMiddleware" in content,
-            "RecommendationRequest model": "class RecommendationRequest" in content,
-            "RecommendationResponse model": "class RecommendationResponse" in content,
-            "Query field in response": '"query"' in content or "'query'" in content or 'query=' in content,
+            "FastAPI import": "FastAPI" in fastapi_names,
+            "Health endpoint": ("get", "/health") in routes,
+            "Recommend endpoint": ("post", "/recommend") in routes,
+            "CORS middleware": "CORSMiddleware" in names,
+            "RecommendationRequest model": "RecommendationRequest" in classes,
+            "RecommendationResponse model": "RecommendationResponse" in classes,
+            "Query field in response": "query" in classes.get("RecommendationResponse", set()),
         }
         
         all_ok = True
@@ -212,8 +271,7 @@ def generate_system_summary():
     }
     
     # Save to JSON
-    with open('system_summary.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+    Path('system_summary.json').write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     
     print("✅ System summary saved to: system_summary.json")
     return summary
@@ -8,8 +8,268 @@ each assessment page to extract detailed information.
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
+import asyncio
+import csv
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from typing import Optional
+from urllib3.util.retry import Retry
+from url_extractor import decode_html, lookup_charset, response_encoding
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # selectolax is optional; fall back to BeautifulSoup without it
+    LexborHTMLParser = None
+
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp is optional; fall back to the thread pool without it
+    aiohttp = None
+
+try:
+    # Registers br decoding with both requests (urllib3) and aiohttp
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    # Without a brotli decoder a br response would arrive undecoded
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+# Assessment pages downloaded concurrently by scrape_shl_assessments
+SCRAPE_WORKERS = 24
+
+# Open connections for the aiohttp scraper
+ASYNC_CONNECTION_LIMIT = 50
+
+# URLs of pre-packaged job solutions, which are excluded from the catalogue
+PREPACKAGED_URL_PATTERN = r'pre-packaged|job[-_]solution'
+
+# Scraped assessments, appended as pages complete
+OUTPUT_PATH = 'data/shl_assessments.csv'
+ASSESSMENT_FIELDS = [
+    'assessment_name',
+    'assessment_url',
+    'assessment_description',
+    'assessment_type',
+    'job_levels',
+    'languages',
+    'assessment_length'
+]
+
+# Rows written between flushes of the output CSV
+FLUSH_EVERY = 20
+
+# Use more modern browser headers
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Retry policy for page fetches: transient failures and these statuses are
+# retried with exponential backoff instead of dropping the assessment
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Shared connection pool so concurrent workers reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF,
+                                         status_forcelist=RETRY_STATUSES, allowed_methods=['GET']))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Elements removed before extracting text
+NON_CONTENT_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'noscript']
+
+# Elements that can label a field, e.g. <h4>Job levels</h4> or <dt>Languages</dt>
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b', 'dt']
+
+# Elements that can hold the value following a heading
+VALUE_TAGS = ['p', 'div', 'dd', 'li', 'span']
+
+
+def _class_selector(tags, words) -> str:
+    """CSS selector for tags whose class attribute contains any of words (case-insensitive)."""
+    return ', '.join(f'{tag}[class*="{word}" i]' for tag in tags for word in words)
+
+
+class _SoupPage:
+    """BeautifulSoup view of a page, used when selectolax is not installed."""
+    
+    def __init__(self, content: bytes, encoding: Optional[str]):
+        # Decode up front: given bytes, BeautifulSoup still runs UnicodeDammit
+        # even when from_encoding is supplied
+        self.soup = BeautifulSoup(decode_html(content, encoding), 'lxml')
+        
+        # Remove script, style, and other non-content elements
+        for element in self.soup(NON_CONTENT_TAGS):
+            element.decompose()
+    
+    def find(self, tags, within=None):
+        """First element with one of the given tag names."""
+        return (within or self.soup).find(tags)
+    
+    def find_all(self, tags, within=None):
+        """All elements with one of the given tag names, in document order."""
+        return (within or self.soup).find_all(tags)
+    
+    def find_classed(self, tags, words):
+        """First element of tags whose class contains any of words (case-insensitive)."""
+        return self.soup.select_one(_class_selector(tags, words))
+    
+    def find_meta(self, name):
+        """Content of <meta name=...>, or None."""
+        meta = self.soup.find('meta', attrs={'name': name})
+        return meta.get('content') if meta else None
+    
+    def text(self, node=None, strip=False):
+        """Text of node (the whole page by default)."""
+        return (node or self.soup).get_text(strip=strip)
+    
+    def next_sibling(self, node):
+        """Next sibling element of node, or None."""
+        return node.find_next_sibling()
+    
+    def find_next(self, node, tags):
+        """First element of tags after node in document order, or None."""
+        return node.find_next(tags)
+    
+    def parent(self, node):
+        """Parent of node, or None."""
+        return node.parent
+
+
+class _LexborPage:
+    """selectolax (lexbor) view of a page with the same interface as _SoupPage."""
+    
+    def __init__(self, content: bytes, encoding: Optional[str]):
+        self.tree = LexborHTMLParser(decode_html(content, encoding))
+        
+        # Remove script, style, and other non-content elements
+        self.tree.strip_tags(NON_CONTENT_TAGS)
+    
+    @staticmethod
+    def _is_element(node) -> bool:
+        # Text, comment and document nodes have tags like '-text'
+        return not node.tag.startswith('-')
+    
+    def find(self, tags, within=None):
+        """First element with one of the given tag names."""
+        selector = tags if isinstance(tags, str) else ', '.join(tags)
+        return (within or self.tree).css_first(selector)
+    
+    def find_all(self, tags, within=None):
+        """All elements with one of the given tag names, in document order."""
+        selector = tags if isinstance(tags, str) else ', '.join(tags)
+        return (within or self.tree).css(selector)
+    
+    def find_classed(self, tags, words):
+        """First element of tags whose class contains any of words (case-insensitive)."""
+        return self.tree.css_first(_class_selector(tags, words))
+    
+    def find_meta(self, name):
+        """Content of <meta name=...>, or None."""
+        meta = self.tree.css_first(f'meta[name="{name}"]')
+        return meta.attributes.get('content') if meta else None
+    
+    def text(self, node=None, strip=False):
+        """Text of node (the whole page by default)."""
+        return (node or self.tree.root).text(deep=True, strip=strip)
+    
+    def next_sibling(self, node):
+        """Next sibling element of node, or None."""
+        node = node.next
+        while node is not None and not self._is_element(node):
+            node = node.next
+        return node
+    
+    def find_next(self, node, tags):
+        """First element of tags after node in document order, or None."""
+        # Descendants of node first, then everything after it
+        following = iter(node.traverse())
+        next(following)
+        for candidate in following:
+            if candidate.tag in tags:
+                return candidate
+        while node is not None:
+            sibling = node.next
+            while sibling is not None:
+                for candidate in sibling.traverse():
+                    if candidate.tag in tags:
+                        return candidate
+                sibling = sibling.next
+            node = node.parent
+        return None
+    
+    def parent(self, node):
+        """Parent of node, or None."""
+        return node.parent
+
+
+# Phrases from the site's browser compatibility banner
+INVALID_PHRASES = [
+    'outdated browser',
+    'recommend upgrading',
+    'modern browser',
+    'cannot guarantee',
+    'wish to continue',
+    'latest browser',
+    'browser options'
+]
+
+# One case-insensitive pass instead of a lower() copy and a scan per phrase
+_INVALID_RE = re.compile('|'.join(map(re.escape, INVALID_PHRASES)), re.IGNORECASE)
+
+
+# Fallback field patterns: the rest of the line after a label in the page text
+_JOB_LEVELS_RE = re.compile(r'Job levels([^\n]*)')
+_LANGUAGES_RE = re.compile(r'Languages([^\n]*)')
+_LENGTH_RE = re.compile(r'Assessment length([^\n]*)')
+_COMPLETION_TIME_RE = re.compile(r'Completion Time([^\n]*)')
+_COMPLETION_TIME_LOWER_RE = re.compile(r'completion time([^\n]*)')
+
+
+# Longest text whose validity check is memoized; page-sized strings cost as
+# much to hash as to search, so only short ones go through the cache
+VALID_TEXT_CACHE_LEN = 200
+
+
+# The same headings, labels and banner lines recur across pages
+@lru_cache(maxsize=2048)
+def _is_valid_short_text(text):
+    """Memoized banner check for short strings."""
+    return _INVALID_RE.search(text) is None
+
+
+def is_valid_text(text):
+    """Check if text is not a browser compatibility message."""
+    if not text or len(text.strip()) < 10:
+        return False
+    # Filter out browser compatibility messages
+    if len(text) <= VALID_TEXT_CACHE_LEN:
+        return _is_valid_short_text(text)
+    return _INVALID_RE.search(text) is None
+
+
+def _line_value(match, max_len: int) -> str:
+    """Return the line captured by a field pattern if it is valid and shorter than max_len."""
+    if match:
+        value = match.group(1).strip()
+        if is_valid_text(value) and len(value) < max_len:
+            return value
+    return ""
 
 
 def scrape_assessment_page(url: str) -> dict:
@@ -23,95 +283,87 @@ def scrape_assessment_page(url: str) -> dict:
         dict: Dictionary with assessment_name, assessment_url, 
               assessment_description, and assessment_type
     """
-    # Use more modern browser headers
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"  Error fetching {url}: {e}")
         return None
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    return parse_assessment_page(response.content, url, response_encoding(response))
+
+
+def parse_assessment_page(content: bytes, url: str, encoding: Optional[str] = None) -> dict:
+    """
+    Extract assessment details from a downloaded page.
     
-    # Remove script, style, and other non-content elements
-    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'noscript']):
-        element.decompose()
+    Uses selectolax's lexbor parser when it is installed and BeautifulSoup
+    otherwise; both run the same extraction strategies.
+    
+    Args:
+        content: Raw HTML of the assessment page
+        url: URL of the assessment page
+        encoding: Charset declared by the server, or None to use the page's
+            <meta charset>
+        
+    Returns:
+        dict: Dictionary with assessment_name, assessment_url, 
+              assessment_description, and assessment_type
+    """
+    page = _LexborPage(content, encoding) if LexborHTMLParser is not None else _SoupPage(content, encoding)
     
     # Extract assessment name (title)
     # Try multiple selectors for title
-    name_elem = soup.find(['h1', 'h2'], class_=lambda x: x and ('title' in x.lower() or 
-                                                                  'heading' in x.lower() or
-                                                                  'name' in x.lower()))
+    name_elem = page.find_classed(['h1', 'h2'], ['title', 'heading', 'name'])
     if not name_elem:
-        name_elem = soup.find('h1')
+        name_elem = page.find('h1')
     if not name_elem:
-        name_elem = soup.find('title')
-    
-    assessment_name = name_elem.get_text(strip=True) if name_elem else "Unknown Assessment"
-    
-    # Filter function to exclude browser compatibility messages
-    def is_valid_text(text):
-        """Check if text is not a browser compatibility message."""
-        if not text or len(text.strip()) < 10:
-            return False
-        text_lower = text.lower()
-        # Filter out browser compatibility messages
-        invalid_phrases = [
-            'outdated browser',
-            'recommend upgrading',
-            'modern browser',
-            'cannot guarantee',
-            'wish to continue',
-            'latest browser',
-            'browser options'
-        ]
-        return not any(phrase in text_lower for phrase in invalid_phrases)
+        name_elem = page.find('title')
+    
+    assessment_name = page.text(name_elem, strip=True) if name_elem else "Unknown Assessment"
+    
+    # Walk the tree once for the page text and the heading candidates;
+    # every field lookup below reuses them
+    full_text = page.text()
+    # (element, text, lowered text) per heading, so matching needs no re-lowering
+    headings = []
+    for heading in page.find_all(HEADING_TAGS):
+        heading_match = page.text(heading).strip()
+        headings.append((heading, heading_match, heading_match.lower()))
     
     # Helper function to extract text after a heading
     def extract_after_heading(heading_text):
         """Find text content after a specific heading."""
-        # Find all headings and text elements
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b', 'dt'])
-        for heading in headings:
-            heading_text_lower = heading.get_text().strip().lower()
-            if heading_text.lower() in heading_text_lower:
+        heading_lower = heading_text.lower()
+        for heading, heading_match, heading_match_lower in headings:
+            if heading_lower in heading_match_lower:
                 # Strategy 1: Get the next sibling element
-                next_elem = heading.find_next_sibling()
+                next_elem = page.next_sibling(heading)
                 if next_elem:
-                    text = next_elem.get_text(strip=True)
+                    text = page.text(next_elem, strip=True)
                     if is_valid_text(text) and len(text) > 5:
                         return text
                 
                 # Strategy 2: Get the next element (could be a div, p, dd, etc.)
-                next_elem = heading.find_next(['p', 'div', 'dd', 'li', 'span'])
+                next_elem = page.find_next(heading, VALUE_TAGS)
                 if next_elem:
-                    text = next_elem.get_text(strip=True)
+                    text = page.text(next_elem, strip=True)
                     if is_valid_text(text) and len(text) > 5:
                         return text
                 
                 # Strategy 3: Get parent's next sibling
-                parent = heading.parent
+                parent = page.parent(heading)
                 if parent:
-                    next_sibling = parent.find_next_sibling()
+                    next_sibling = page.next_sibling(parent)
                     if next_sibling:
-                        text = next_sibling.get_text(strip=True)
+                        text = page.text(next_sibling, strip=True)
                         if is_valid_text(text) and len(text) > 5:
                             return text
                     
                     # Strategy 4: Get text from the same parent (after the heading)
-                    parent_text = parent.get_text(strip=True)
+                    parent_text = page.text(parent, strip=True)
                     if parent_text:
                         # Extract text after the heading
-                        heading_match = heading.get_text().strip()
                         if heading_match in parent_text:
                             parts = parent_text.split(heading_match, 1)
                             if len(parts) > 1:
@@ -123,9 +375,8 @@ def scrape_assessment_page(url: str) -> dict:
                                     return text
         
         # Strategy 5: Search in all text for the heading pattern
-        all_text = soup.get_text()
-        if heading_text in all_text:
-            parts = all_text.split(heading_text, 1)
+        if heading_text in full_text:
+            parts = full_text.split(heading_text, 1)
             if len(parts) > 1:
                 # Get the text after the heading (first line or first sentence)
                 next_part = parts[1].strip()
@@ -151,33 +402,29 @@ def scrape_assessment_page(url: str) -> dict:
     
     # Strategy 2: Try meta description tag
     if not assessment_description or not is_valid_text(assessment_description):
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            assessment_description = meta_desc.get('content', '').strip()
+        meta_content = page.find_meta('description')
+        if meta_content:
+            assessment_description = meta_content.strip()
             if not is_valid_text(assessment_description):
                 assessment_description = ""
     
     # Strategy 3: Try to find main content area
     if not assessment_description or not is_valid_text(assessment_description):
         # Look for main content containers
-        main_content = soup.find(['main', 'article', 'div'], 
-                                class_=lambda x: x and ('content' in x.lower() or 
-                                                       'main' in x.lower() or
-                                                       'body' in x.lower() or
-                                                       'article' in x.lower()))
+        main_content = page.find_classed(['main', 'article', 'div'], ['content', 'main', 'body', 'article'])
         if main_content:
             # Get all paragraphs from main content
-            paragraphs = main_content.find_all('p')
-            valid_paragraphs = [p.get_text(strip=True) for p in paragraphs if is_valid_text(p.get_text(strip=True))]
+            paragraphs = page.find_all('p', within=main_content)
+            valid_paragraphs = [page.text(p, strip=True) for p in paragraphs if is_valid_text(page.text(p, strip=True))]
             if valid_paragraphs:
                 # Take first few valid paragraphs
                 assessment_description = ' '.join(valid_paragraphs[:3])
     
     # Strategy 4: Find all paragraphs and filter
     if not assessment_description or not is_valid_text(assessment_description):
-        all_paragraphs = soup.find_all('p')
+        all_paragraphs = page.find_all('p')
         for p in all_paragraphs:
-            text = p.get_text(strip=True)
+            text = page.text(p, strip=True)
             if is_valid_text(text) and len(text) > 50:  # Minimum length
                 assessment_description = text
                 break
@@ -198,15 +445,8 @@ def scrape_assessment_page(url: str) -> dict:
     if job_levels_text:
         job_levels = job_levels_text.strip()
     else:
-        # Try alternative: look for text containing "Job levels"
-        all_text = soup.get_text()
-        if "Job levels" in all_text:
-            # Extract text after "Job levels"
-            parts = all_text.split("Job levels", 1)
-            if len(parts) > 1:
-                next_part = parts[1].split("\n", 1)[0].strip()
-                if is_valid_text(next_part) and len(next_part) < 500:
-                    job_levels = next_part
+        # Try alternative: the rest of the line after "Job levels"
+        job_levels = _line_value(_JOB_LEVELS_RE.search(full_text), 500)
     
     # Extract Languages
     languages = ""
@@ -214,15 +454,8 @@ def scrape_assessment_page(url: str) -> dict:
     if languages_text:
         languages = languages_text.strip()
     else:
-        # Try alternative: look for text containing "Languages"
-        all_text = soup.get_text()
-        if "Languages" in all_text:
-            # Extract text after "Languages"
-            parts = all_text.split("Languages", 1)
-            if len(parts) > 1:
-                next_part = parts[1].split("\n", 1)[0].strip()
-                if is_valid_text(next_part) and len(next_part) < 500:
-                    languages = next_part
+        # Try alternative: the rest of the line after "Languages"
+        languages = _line_value(_LANGUAGES_RE.search(full_text), 500)
     
     # Extract Assessment length
     assessment_length = ""
@@ -230,47 +463,31 @@ def scrape_assessment_page(url: str) -> dict:
     if length_text:
         assessment_length = length_text.strip()
     else:
-        # Try alternative: look for text containing "Assessment length" or "Completion Time"
-        all_text = soup.get_text()
-        if "Assessment length" in all_text:
-            parts = all_text.split("Assessment length", 1)
-            if len(parts) > 1:
-                next_part = parts[1].split("\n", 1)[0].strip()
-                if is_valid_text(next_part) and len(next_part) < 200:
-                    assessment_length = next_part
-        elif "Completion Time" in all_text or "completion time" in all_text:
-            parts = all_text.split("Completion Time", 1) if "Completion Time" in all_text else all_text.split("completion time", 1)
-            if len(parts) > 1:
-                next_part = parts[1].split("\n", 1)[0].strip()
-                if is_valid_text(next_part) and len(next_part) < 200:
-                    assessment_length = next_part
+        # Try alternative: the line after "Assessment length", else after "Completion Time"
+        match = (_LENGTH_RE.search(full_text)
+                 or _COMPLETION_TIME_RE.search(full_text)
+                 or _COMPLETION_TIME_LOWER_RE.search(full_text))
+        assessment_length = _line_value(match, 200)
     
     # Extract assessment type/category
     # Try to find category/type information
-    type_elem = soup.find(['span', 'div', 'p'], 
-                         class_=lambda x: x and ('type' in x.lower() or 
-                                                'category' in x.lower() or
-                                                'tag' in x.lower() or
-                                                'classification' in x.lower()))
+    type_elem = page.find_classed(['span', 'div', 'p'], ['type', 'category', 'tag', 'classification'])
     if not type_elem:
         # Try to infer from breadcrumbs or navigation
-        breadcrumb = soup.find(['nav', 'div'], class_=lambda x: x and 'breadcrumb' in x.lower())
+        breadcrumb = page.find_classed(['nav', 'div'], ['breadcrumb'])
         if breadcrumb:
-            type_elem = breadcrumb.find('a')
+            type_elem = page.find('a', within=breadcrumb)
     
-    assessment_type = type_elem.get_text(strip=True) if type_elem else "General"
+    assessment_type = page.text(type_elem, strip=True) if type_elem else "General"
     
     # If type is still "General", try to infer from URL or page content
     if assessment_type == "General":
         # Get text from main content area (avoiding browser messages)
-        main_content = soup.find(['main', 'article', 'div'], 
-                                class_=lambda x: x and ('content' in x.lower() or 
-                                                       'main' in x.lower() or
-                                                       'body' in x.lower()))
+        main_content = page.find_classed(['main', 'article', 'div'], ['content', 'main', 'body'])
         if main_content:
-            page_text = main_content.get_text().lower()
+            page_text = page.text(main_content).lower()
         else:
-            page_text = soup.get_text().lower()
+            page_text = full_text.lower()
         
         # Filter out browser messages
         if is_valid_text(page_text):
@@ -292,18 +509,98 @@ def scrape_assessment_page(url: str) -> dict:
     }
 
 
-def scrape_shl_assessments():
+def _scrape_pages_threaded(urls: list, on_result):
+    """Scrape pages on a thread pool, calling on_result(url, data) as each completes."""
+    with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+        futures = {executor.submit(scrape_assessment_page, url): url for url in urls}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Scraping assessments", unit="assessment"):
+            on_result(futures[future], future.result())
+
+
+async def _fetch_and_parse(session, url: str) -> dict:
+    """Download one page with aiohttp and parse it in a worker thread."""
+    # Same retry policy as the requests SESSION adapter
+    for attempt in range(RETRY_TOTAL + 1):
+        if attempt:
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status in RETRY_STATUSES and attempt < RETRY_TOTAL:
+                    continue
+                response.raise_for_status()
+                content = await response.read()
+                encoding = lookup_charset(response.charset)
+            break
+        except aiohttp.ClientResponseError as e:
+            print(f"  Error fetching {url}: {e}")
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == RETRY_TOTAL:
+                print(f"  Error fetching {url}: {e}")
+                return None
+    
+    # Parsing is CPU-bound; keep it off the event loop
+    return await asyncio.to_thread(parse_assessment_page, content, url, encoding)
+
+
+async def _scrape_pages_async(urls: list, on_result):
+    """Scrape pages on one event loop, calling on_result(url, data) as each completes."""
+    connector = aiohttp.TCPConnector(limit=ASYNC_CONNECTION_LIMIT)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        async def scrape(url):
+            on_result(url, await _fetch_and_parse(session, url))
+        
+        tasks = [asyncio.ensure_future(scrape(url)) for url in urls]
+        for completed in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Scraping assessments", unit="assessment"):
+            await completed
+
+
+def _load_scraped_urls(output_path: str) -> set:
+    """Return the assessment URLs already saved in output_path."""
+    if not os.path.exists(output_path):
+        return set()
+    with open(output_path, newline='', encoding='utf-8') as f:
+        return {row['assessment_url'] for row in csv.DictReader(f) if row.get('assessment_url')}
+
+
+def _drop_partial_row(output_path: str):
+    """
+    Truncate output_path after its last complete CSV row.
+    
+    A run killed mid-write can leave half a row at the end of the file;
+    appending after it would merge that fragment with the next row.
+    """
+    if not os.path.exists(output_path):
+        return
+    with open(output_path, 'rb+') as f:
+        data = f.read()
+        end = len(data)
+        # A row ends at a newline outside quotes, i.e. after an even number of '"'
+        while end and not (data[end - 1:end] == b'\n' and data.count(b'"', 0, end) % 2 == 0):
+            end = data.rfind(b'\n', 0, end - 1) + 1
+        if end < len(data):
+            print(f"Dropping incomplete last row of {output_path}")
+            f.truncate(end)
+
+
+def scrape_shl_assessments(output_path: str = OUTPUT_PATH) -> int:
     """
     Read assessment URLs from Excel file and scrape each page.
     
+    Rows are appended to output_path as pages complete, so an interrupted
+    run can be resumed: URLs already in the file are not fetched again.
+    
+    Args:
+        output_path: CSV file to write assessment information to
+        
     Returns:
-        pd.DataFrame: DataFrame containing assessment information
+        int: Number of assessments in output_path
     """
     excel_path = 'Gen_AI_Dataset.xlsx'
     
     if not os.path.exists(excel_path):
         print(f"Error: {excel_path} not found.")
-        return pd.DataFrame()
+        return 0
     
     print(f"Reading Excel file: {excel_path}")
     
@@ -312,7 +609,7 @@ def scrape_shl_assessments():
         df_excel = pd.read_excel(excel_path)
     except Exception as e:
         print(f"Error reading Excel file: {e}")
-        return pd.DataFrame()
+        return 0
     
     # Check if required columns exist (case-insensitive)
     url_column = None
@@ -324,7 +621,7 @@ def scrape_shl_assessments():
     if url_column is None:
         print("Error: 'Assessment_url' column not found in Excel file.")
         print(f"Available columns: {df_excel.columns.tolist()}")
-        return pd.DataFrame()
+        return 0
     
     print(f"Found {len(df_excel)} rows in Excel file.")
     print(f"Using column: '{url_column}'")
@@ -333,40 +630,63 @@ def scrape_shl_assessments():
     unique_urls = df_excel[url_column].dropna().unique()
     print(f"Found {len(unique_urls)} unique assessment URLs.")
     
-    # Scrape each assessment page
-    assessments = []
-    for url in tqdm(unique_urls, desc="Scraping assessments", unit="assessment"):
-        # Ensure URL is complete
-        if not url.startswith('http'):
-            url = f"https://www.shl.com{url}" if url.startswith('/') else f"https://www.shl.com/{url}"
+    # Ensure URLs are complete, as one vectorized pass over the column
+    url_series = pd.Series(unique_urls, dtype=str)
+    url_series = url_series.where(
+        url_series.str.startswith('http'),
+        'https://www.shl.com' + url_series.where(url_series.str.startswith('/'), '/' + url_series)
+    ).drop_duplicates()
+    
+    # Skip pre-packaged job solutions (as per requirements)
+    prepackaged = url_series.str.contains(PREPACKAGED_URL_PATTERN, case=False, regex=True)
+    for url in url_series[prepackaged]:
+        tqdm.write(f"Skipping pre-packaged job solution: {url}")
+    
+    # Resume: skip assessments saved by an earlier run
+    _drop_partial_row(output_path)
+    seen_urls = _load_scraped_urls(output_path)
+    if seen_urls:
+        print(f"Resuming: {len(seen_urls)} assessments already in {output_path}")
+    urls = [url for url in url_series[~prepackaged] if url not in seen_urls]
+    
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    write_header = not seen_urls
+    with open(output_path, 'w' if write_header else 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=ASSESSMENT_FIELDS)
+        if write_header:
+            writer.writeheader()
+        written = 0
         
-        # Skip pre-packaged job solutions (as per requirements)
-        url_lower = url.lower()
-        if 'pre-packaged' in url_lower or 'job-solution' in url_lower or 'job_solution' in url_lower:
-            tqdm.write(f"Skipping pre-packaged job solution: {url}")
-            continue
-        
-        assessment_data = scrape_assessment_page(url)
-        
-        if assessment_data:
+        def on_result(url, assessment_data):
+            nonlocal written
+            if not assessment_data:
+                tqdm.write(f"Failed to scrape: {url}")
+                return
+            
             # Additional check: skip if it's a pre-packaged solution based on name/description
             name_lower = assessment_data.get('assessment_name', '').lower()
             desc_lower = assessment_data.get('assessment_description', '').lower()
             if 'pre-packaged' in name_lower or 'pre-packaged' in desc_lower:
                 tqdm.write(f"Skipping pre-packaged job solution: {assessment_data.get('assessment_name')}")
-                continue
+                return
             
-            assessments.append(assessment_data)
+            # Remove duplicates based on URL
+            if assessment_data['assessment_url'] in seen_urls:
+                return
+            seen_urls.add(assessment_data['assessment_url'])
+            
+            writer.writerow(assessment_data)
+            written += 1
+            if written % FLUSH_EVERY == 0:
+                f.flush()
+        
+        # Scrape assessment pages concurrently
+        if aiohttp is not None:
+            asyncio.run(_scrape_pages_async(urls, on_result))
         else:
-            tqdm.write(f"Failed to scrape: {url}")
+            _scrape_pages_threaded(urls, on_result)
     
-    # Create DataFrame
-    df = pd.DataFrame(assessments)
-    
-    # Remove duplicates based on URL
-    df = df.drop_duplicates(subset=['assessment_url'], keep='first')
-    
-    return df
+    return len(seen_urls)
 
 
 def main():
@@ -374,25 +694,18 @@ def main():
     print("Starting SHL assessment scraper...")
     
     # Scrape assessments
-    df = scrape_shl_assessments()
+    output_path = OUTPUT_PATH
+    count = scrape_shl_assessments(output_path)
     
-    if df.empty:
+    if count == 0:
         print("Warning: No assessments found. The website structure may have changed.")
         print("Please check the website and update the scraper selectors accordingly.")
     else:
-        # Ensure data directory exists
-        os.makedirs('data', exist_ok=True)
-        
-        # Save to CSV
-        output_path = 'data/shl_assessments.csv'
-        df.to_csv(output_path, index=False, encoding='utf-8')
-        
-        print(f"\nScraping complete. Found {len(df)} assessments.")
+        print(f"\nScraping complete. Found {count} assessments.")
         print(f"Data saved to: {output_path}")
         print(f"\nSample data:")
-        print(df.head())
+        print(pd.read_csv(output_path, nrows=5))
 
 
 if __name__ == "__main__":
     main()
-
@@ -4,10 +4,149 @@ URL Extractor for Job Descriptions
 This module extracts text content from job description URLs.
 """
 
+import codecs
 import requests
 from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from requests.adapters import HTTPAdapter
+from typing import Optional
 import re
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # selectolax is optional; fall back to BeautifulSoup without it
+    LexborHTMLParser = None
+
+
+# Elements that never hold job description text
+NON_CONTENT_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'noscript']
+
+# Containers whose class suggests the main job description, matched as a
+# case-insensitive substring of the class attribute
+MAIN_CONTENT_SELECTOR = ', '.join(
+    f'{tag}[class*="{word}" i]'
+    for tag in ['main', 'article', 'div']
+    for word in ['content', 'main', 'body', 'article', 'job', 'description']
+)
+
+# Prefixes that mark a query as a URL rather than a job description
+URL_PREFIXES = ('http://', 'https://', 'www.')
+
+# Runs of whitespace, collapsed to a single space in extracted text
+_WS_RE = re.compile(r'\s+')
+
+# Shared keep-alive session for job description fetches
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+})
+SESSION.mount('http://', HTTPAdapter(pool_maxsize=32))
+SESSION.mount('https://', HTTPAdapter(pool_maxsize=32))
+
+
+def lookup_charset(charset: Optional[str]) -> Optional[str]:
+    """
+    Return charset if Python has a codec for it, otherwise None.
+    
+    Servers sometimes declare labels such as 'utf8mb4' that are not valid
+    encodings; decoding with them would raise LookupError.
+    
+    Args:
+        charset: Charset label from a header or meta tag, or None
+        
+    Returns:
+        str: The charset, or None if it is missing or unknown
+    """
+    if not charset:
+        return None
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return None
+    return charset
+
+
+def response_encoding(response: requests.Response) -> Optional[str]:
+    """
+    Return the charset declared in the response's Content-Type header.
+    
+    requests reports ISO-8859-1 for text/html without a declared charset,
+    so that guess is ignored and None returned instead; decode_html then
+    uses the page's own <meta charset>.
+    
+    Args:
+        response: HTTP response for an HTML page
+        
+    Returns:
+        str: Declared encoding name, or None if none (or an unknown one) is declared
+    """
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return lookup_charset(response.encoding)
+    return None
+
+
+def decode_html(content: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Decode an HTML page to text.
+    
+    Decoding up front lets the parsers skip their own encoding detection.
+    
+    Args:
+        content: Raw HTML bytes
+        encoding: Charset declared by the server, or None to use the page's
+            <meta charset> and fall back to UTF-8
+        
+    Returns:
+        str: Decoded HTML; undecodable bytes are replaced
+    """
+    if encoding is None:
+        declared = EncodingDetector.find_declared_encoding(content, is_html=True)
+        encoding = lookup_charset(declared) or 'utf-8'
+    return content.decode(encoding, errors='replace')
+
+
+def html_to_text(html: str) -> str:
+    """
+    Return the visible text of the page's main content area.
+    
+    Uses selectolax's lexbor parser when it is installed and BeautifulSoup
+    otherwise.
+    
+    Args:
+        html: Decoded HTML of the page
+        
+    Returns:
+        str: Text of the main content container, or of the body if none matches
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        
+        # Remove script, style, and other non-content elements
+        tree.strip_tags(NON_CONTENT_TAGS)
+        
+        # Try to find main content area, falling back to body text
+        node = tree.css_first(MAIN_CONTENT_SELECTOR) or tree.body or tree.root
+        return node.text(separator=' ', strip=True)
+    
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Remove script, style, and other non-content elements
+    for element in soup(NON_CONTENT_TAGS):
+        element.decompose()
+    
+    # Try to find main content area
+    main_content = soup.select_one(MAIN_CONTENT_SELECTOR)
+    
+    if main_content:
+        return main_content.get_text(separator=' ', strip=True)
+    
+    # Fallback to body text
+    body = soup.find('body')
+    if body:
+        return body.get_text(separator=' ', strip=True)
+    return soup.get_text(separator=' ', strip=True)
+
 
 def extract_text_from_url(url: str) -> str:
     """
@@ -20,39 +159,14 @@ def extract_text_from_url(url: str) -> str:
         str: Extracted text content
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script, style, and other non-content elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'noscript']):
-            element.decompose()
-        
-        # Try to find main content area
-        main_content = soup.find(['main', 'article', 'div'], 
-                                class_=lambda x: x and ('content' in x.lower() or 
-                                                       'main' in x.lower() or
-                                                       'body' in x.lower() or
-                                                       'article' in x.lower() or
-                                                       'job' in x.lower() or
-                                                       'description' in x.lower()))
-        
-        if main_content:
-            text = main_content.get_text(separator=' ', strip=True)
-        else:
-            # Fallback to body text
-            body = soup.find('body')
-            if body:
-                text = body.get_text(separator=' ', strip=True)
-            else:
-                text = soup.get_text(separator=' ', strip=True)
+        html = decode_html(response.content, response_encoding(response))
+        text = html_to_text(html)
         
         # Clean up text
-        text = re.sub(r'\s+', ' ', text)  # Replace multiple whitespace with single space
+        text = _WS_RE.sub(' ', text)  # Replace multiple whitespace with single space
         text = text.strip()
         
         return text
@@ -73,10 +187,7 @@ def is_url(text: str) -> bool:
     Returns:
         bool: True if text appears to be a URL
     """
-    text = text.strip()
-    return (text.startswith('http://') or 
-            text.startswith('https://') or
-            text.startswith('www.'))
+    return text.strip().startswith(URL_PREFIXES)
 
 
 def process_query(query: str) -> str:
@@ -7,6 +7,11 @@ This script validates that the API endpoints match the specification requirement
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Shared keep-alive session so every check reuses one connection pool
+SESSION = requests.Session()
 
 
 def test_health_endpoint(base_url: str = "http://127.0.0.1:8000"):
@@ -16,7 +21,7 @@ def test_health_endpoint(base_url: str = "http://127.0.0.1:8000"):
     print("=" * 60)
     
     try:
-        response = requests.get(f"{base_url}/health", timeout=10)
+        response = SESSION.get(f"{base_url}/health", timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -53,16 +58,19 @@ def test_recommend_endpoint(base_url: str = "http://127.0.0.1:8000"):
     
     all_passed = True
     
-    for i, query in enumerate(test_queries, 1):
+    # Send all queries at once; responses are checked below in query order
+    with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+        futures = [
+            executor.submit(SESSION.post, f"{base_url}/recommend", json={"query": query}, timeout=60)
+            for query in test_queries
+        ]
+    
+    for i, (query, future) in enumerate(zip(test_queries, futures), 1):
         print(f"\n--- Test Query {i} ---")
         print(f"Query: {query[:60]}...")
         
         try:
-            response = requests.post(
-                f"{base_url}/recommend",
-                json={"query": query},
-                timeout=60
-            )
+            response = future.result()
             
             if response.status_code == 200:
                 data = response.json()